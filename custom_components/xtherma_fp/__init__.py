@@ -23,18 +23,25 @@ from .const import (
     CONF_CONNECTION_RESTAPI,
     CONF_DETECT_EMPTY_MODBUS_DATA,
     CONF_SERIAL_NUMBER,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_STANDBY_UPDATE_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD_S,
+    DEFAULT_STANDBY_UPDATE_INTERVAL_S,
     DOMAIN,
     FERNPORTAL_URL,
     MANUFACTURER,
     VERSION,
 )
 from .coordinator import XthermaDataUpdateCoordinator
+from .xtherma_client_hybrid import XthermaClientHybrid
 from .xtherma_client_modbus import XthermaClientModbus
 from .xtherma_client_rest import XthermaClientRest
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
 
+    from .xtherma_client_common import XthermaClient
+
 type XthermaConfigEntry = ConfigEntry[XthermaData]
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,6 +74,8 @@ async def async_setup_entry(
 
     # create API client connector
     connection = entry.data.get(CONF_CONNECTION, CONF_CONNECTION_RESTAPI)
+    client: XthermaClient
+    modbus_client: XthermaClientModbus | None = None
     if connection == CONF_CONNECTION_RESTAPI:
         api_key = entry.data[CONF_API_KEY]
         client = XthermaClientRest(
@@ -80,11 +89,22 @@ async def async_setup_entry(
         host = entry.data[CONF_HOST]
         port = entry.data[CONF_PORT]
         address = entry.data[CONF_ADDRESS]
-        client = XthermaClientModbus(
+        client = modbus_client = XthermaClientModbus(
             host=host,
             port=port,
             address=address,
         )
+        if api_key := entry.data.get(CONF_API_KEY):
+            # read Fernportal while Modbus cannot be read
+            client = XthermaClientHybrid(
+                modbus_client,
+                XthermaClientRest(
+                    url=FERNPORTAL_URL,
+                    api_key=api_key,
+                    serial_number=serial_number,
+                    session=async_get_clientsession(hass),
+                ),
+            )
 
     coordinator = XthermaDataUpdateCoordinator(hass, entry, client)
     device_info = dr.DeviceInfo(
@@ -119,9 +139,15 @@ async def async_setup_entry(
     ) -> None:
         """Handle options update."""
         del hass
-        if isinstance(client, XthermaClientModbus):
+        coordinator.stale_grace_period = config_entry.options.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD_S
+        )
+        coordinator.standby_update_interval = config_entry.options.get(
+            CONF_STANDBY_UPDATE_INTERVAL, DEFAULT_STANDBY_UPDATE_INTERVAL_S
+        )
+        if modbus_client is not None:
             detect_empty = config_entry.options.get(CONF_DETECT_EMPTY_MODBUS_DATA, True)
-            client.detect_empty_modbus_data = detect_empty
+            modbus_client.detect_empty_modbus_data = detect_empty
 
     await update_options_listener(hass, entry)
 
@@ -0,0 +1,65 @@
+"""Stop polling devices which do not respond."""
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Consecutive failed polls after which the device is considered offline.
+_FAILURE_THRESHOLD = 3
+
+# Probe intervals in seconds grow exponentially up to this maximum.
+_PROBE_INTERVAL_MAX_S = 600.0
+
+
+class CircuitBreaker:
+    """Track consecutive failures of a device.
+
+    After several failed polls the breaker opens. While it is open, full
+    polls are replaced by cheap probes at increasing intervals. The first
+    successful probe closes the breaker again.
+    """
+
+    def __init__(
+        self,
+        probe_interval_s: float,
+        failure_threshold: int = _FAILURE_THRESHOLD,
+        probe_interval_max_s: float = _PROBE_INTERVAL_MAX_S,
+    ) -> None:
+        """Class constructor."""
+        self._probe_interval_s = probe_interval_s
+        self._probe_interval_max_s = max(probe_interval_s, probe_interval_max_s)
+        self._failure_threshold = failure_threshold
+        self._failures = 0
+        # monotonic time of the next probe while open
+        self._next_probe = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return if the device is considered offline."""
+        return self._failures >= self._failure_threshold
+
+    def probe_due(self) -> bool:
+        """Test if the device should be probed now."""
+        return time.monotonic() >= self._next_probe
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        if self.is_open:
+            _LOGGER.info("Device responds again, resuming updates")
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed poll or probe."""
+        self._failures += 1
+        if not self.is_open:
+            return
+        probes = self._failures - self._failure_threshold
+        interval = min(self._probe_interval_max_s, self._probe_interval_s * 2**probes)
+        if probes == 0:
+            _LOGGER.warning(
+                "Device did not respond %d times, probing every %.0f seconds",
+                self._failures,
+                interval,
+            )
+        self._next_probe = time.monotonic() + interval
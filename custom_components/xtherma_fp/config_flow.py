@@ -38,6 +38,10 @@ from .const import (
     CONF_CONNECTION_RESTAPI,
     CONF_DETECT_EMPTY_MODBUS_DATA,
     CONF_SERIAL_NUMBER,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_STANDBY_UPDATE_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD_S,
+    DEFAULT_STANDBY_UPDATE_INTERVAL_S,
     DOMAIN,
     FERNPORTAL_URL,
 )
@@ -95,6 +99,28 @@ OPTIONS_DATA = {
         CONF_DETECT_EMPTY_MODBUS_DATA,
         default=_DEF_DETECT_EMPTY_MODBUS_DATA,
     ): BOOLEAN_SELECTOR,
+    vol.Optional(
+        CONF_STALE_GRACE_PERIOD,
+        default=DEFAULT_STALE_GRACE_PERIOD_S,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=0,
+            max=3600,
+            unit_of_measurement="s",
+            mode=NumberSelectorMode.BOX,
+        ),
+    ),
+    vol.Optional(
+        CONF_STANDBY_UPDATE_INTERVAL,
+        default=DEFAULT_STANDBY_UPDATE_INTERVAL_S,
+    ): NumberSelector(
+        NumberSelectorConfig(
+            min=0,
+            max=3600,
+            unit_of_measurement="s",
+            mode=NumberSelectorMode.BOX,
+        ),
+    ),
 }
 
 
@@ -125,6 +151,8 @@ MODBUS_SCHEMA = vol.Schema(
                 ),
             ),
         ),
+        # Fernportal is read while Modbus cannot be read
+        vol.Optional(CONF_API_KEY): str,
     },
 )
 
@@ -168,8 +196,11 @@ async def _validate_rest_api(
             session=session,
         )
         await client.connect()
-        await client.async_get_data()
-        await client.disconnect()
+        try:
+            await client.async_get_data()
+        finally:
+            # stop drawing from the budget of the API key
+            await client.disconnect()
     except XthermaRestBusyError:
         _LOGGER.debug("RateLimitError")
         errors["base"] = "rate_limit"
@@ -214,9 +245,12 @@ async def _validate_modbus_tcp(
             port=int(port),
             address=int(address),
         )
-        await client.connect()
-        await client.async_get_data()
-        await client.disconnect()
+        try:
+            await client.connect()
+            await client.async_get_data()
+        finally:
+            # close the shared connection, unless entries use it
+            await client.disconnect()
     except XthermaTimeoutError:
         _LOGGER.debug("TimeoutError")
         errors["base"] = "timeout"
@@ -312,13 +346,21 @@ class XthermaConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             self._async_abort_entries_match(
-                {CONF_HOST: user_input[CONF_HOST], CONF_PORT: user_input[CONF_PORT]}
+                {
+                    CONF_HOST: user_input[CONF_HOST],
+                    CONF_PORT: user_input[CONF_PORT],
+                    CONF_ADDRESS: user_input[CONF_ADDRESS],
+                }
             )
 
             errors |= await _validate_modbus_tcp(
                 self.hass,
                 user_input,
             )
+            if not errors and user_input.get(CONF_API_KEY):
+                errors |= await _validate_rest_api(
+                    self.hass, self._config_data, user_input
+                )
             if not errors:
                 self._config_data.update(user_input)
                 return self.async_create_entry(
@@ -394,14 +436,25 @@ class XthermaConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             self._async_abort_entries_match(
-                {CONF_HOST: user_input[CONF_HOST], CONF_PORT: user_input[CONF_PORT]}
+                {
+                    CONF_HOST: user_input[CONF_HOST],
+                    CONF_PORT: user_input[CONF_PORT],
+                    CONF_ADDRESS: user_input[CONF_ADDRESS],
+                }
             )
 
             errors |= await _validate_modbus_tcp(self.hass, user_input)
+            if not errors and user_input.get(CONF_API_KEY):
+                errors |= await _validate_rest_api(
+                    self.hass, self._reconfigure_data, user_input
+                )
             if not errors:
                 self._reconfigure_data.update(user_input)
+                if not user_input.get(CONF_API_KEY):
+                    # stop reading Fernportal
+                    self._reconfigure_data.pop(CONF_API_KEY, None)
                 return self.async_update_reload_and_abort(
-                    self._get_reconfigure_entry(), data_updates=self._reconfigure_data
+                    self._get_reconfigure_entry(), data=self._reconfigure_data
                 )
 
         return self.async_show_form(
@@ -19,10 +19,20 @@ CONF_CONNECTION_MODBUSTCP = "modbus_tcp"
 
 # options keys
 CONF_DETECT_EMPTY_MODBUS_DATA = "detect_empty_modbus_data"
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+CONF_STANDBY_UPDATE_INTERVAL = "standby_update_interval"
+
+# seconds during which the last values are shown after failed updates
+DEFAULT_STALE_GRACE_PERIOD_S = 300
+
+# longest seconds between updates while the heat pump is in standby
+DEFAULT_STANDBY_UPDATE_INTERVAL_S = 120
 
 FERNPORTAL_URL = "https://fernportal.xtherma.de/api/device"
 
-# Fernportal is rate limited to 1500 requests per day, one per minute
+# Fernportal allows one request per minute and API key, and 1500 requests per
+# day. Requests are sent at most once per FERNPORTAL_RATE_LIMIT_S.
+FERNPORTAL_REQUESTS_PER_DAY = 1500
 FERNPORTAL_RATE_LIMIT_S = 61
 
 # timeout in seconds before we stop trying to get a response
@@ -31,6 +41,11 @@ FERNPORTAL_TIMEOUT_S = 10
 # timeout in seconds before we stop trying to get a response
 MODBUS_TIMEOUT_S = 2
 
+# refresh periods in seconds of Modbus register sets. Settings rarely
+# change, so they are read much less frequently than telemetry.
+MODBUS_TELEMETRY_UPDATE_PERIOD_S = 30
+MODBUS_SETTINGS_UPDATE_PERIOD_S = 600
+
 # keys in the response data
 
 # element on top level
@@ -51,3 +66,4 @@ KEY_ENTRY_INPUT_FACTOR = "input_factor"
 
 # additional entity state attributes
 EXTRA_STATE_ATTRIBUTE_PARAMETER = "parameter"
+EXTRA_STATE_ATTRIBUTE_LAST_READ = "last_read"
@@ -1,19 +1,31 @@
 """DataUpdater for Xtherma Fernportal cloud integration."""
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import math
+import time
+from dataclasses import asdict, dataclass
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+import homeassistant.helpers.entity_registry as er
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity, EntityDescription
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .circuit_breaker import CircuitBreaker
 from .const import (
+    DEFAULT_STALE_GRACE_PERIOD_S,
+    DEFAULT_STANDBY_UPDATE_INTERVAL_S,
     DOMAIN,
 )
+from .entity_descriptors import XtWritableEntityDescription
+from .refresh_phase import RefreshPhase
 from .xtherma_client_common import (
+    XthermaDeviceOfflineError,
+    XthermaError,
     XthermaModbusBusyError,
     XthermaModbusEmptyDataError,
     XthermaModbusError,
@@ -32,16 +44,101 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-# Time in seconds the device needs to process a write request.
-# During this time, we block reads which would potentially restore
-# the old value.
+# Time in seconds the device may need to process a write request.
+# Until the device confirms the written value, we block reads which would
+# potentially restore the old value.
 _WRITE_SETTLE_TIME_S = 30
 
+# Delays in seconds between reads confirming written values, adding up to
+# the settle time. Written values stay pending until the last read, even if
+# reads took longer and their block expired.
+_WRITE_CONFIRM_DELAYS_S: tuple[float, ...] = (1, 2, 4, 8, 15)
+
+# Values read back are compared with this tolerance, as input factors may
+# introduce rounding errors.
+_WRITE_CONFIRM_TOLERANCE = 1e-6
+
+# Delays in seconds between reads of values derived from confirmed writes.
+# The device may need a moment to derive them, so they are read until they
+# change, but only a few times, as they do not have to change.
+_DEPENDENTS_READ_DELAYS_S: tuple[float, ...] = (0, 5, 10)
+
+# Writes are sent once no further write arrived for this time. Writes of
+# several keys are sent together, so the client can combine writes of
+# adjacent registers into one request. Of several writes to one key, only
+# the last value is sent.
+_WRITE_DEBOUNCE_S = 0.3
+
+# Writes are sent after this time at the latest, even if writes keep coming.
+_WRITE_MAX_DELAY_S = 2.0
+
+# Updates are aborted after this fraction of the client's update interval,
+# so slow updates never delay the next one.
+_UPDATE_DEADLINE_FRACTION = 0.8
+
+# Entities are only notified about changed values. In this interval, all
+# entities are notified anyway, so their states get reported regularly.
+_FULL_DISPATCH_INTERVAL_S = 900
+
+# Telemetry keys showing that the heat pump is working: compressor frequency
+# and circulation pumps. The operating mode is checked as well.
+_ACTIVITY_KEYS = ("vf", "pk", "pww")
+_MODE_KEY = "mode"
+_MODE_STANDBY = 0
+
+# Telemetry keys which change with almost every refresh of device values.
+# Their changes tell when the device refreshes, so polls can follow closely.
+_REFRESH_KEYS = ("ta", "in_hp", "tvl", "trl", "tw")
+
+# Values missing from this many updates of their period are stale, e.g. if
+# parts of the device could not be read. Stale values are still shown for
+# the grace period.
+_STALE_UPDATE_PERIODS = 3
+
+# While updates fail, all values are stale once this many updates were
+# missed, and are only shown for the grace period.
+_STALE_MISSED_UPDATES = 2
+
+
+class _Freshness(Enum):
+    # read with recent updates
+    FRESH = auto()
+    # missed updates, but still shown for the grace period
+    STALE = auto()
+    # never read or too old, shown as unavailable
+    EXPIRED = auto()
+
 
 @dataclass
 class _PendingWrite:
     value: int | float
-    blocked_until: datetime
+    # monotonic time after which reads are no longer blocked
+    expires: float
+
+
+@dataclass
+class _QueuedWrite:
+    desc: EntityDescription
+    value: int | float
+    # callers waiting for the write, including those of replaced values
+    results: list[asyncio.Future[None]]
+
+
+@dataclass
+class UpdateCycleStats:
+    """Counters of updates which did not run as scheduled."""
+
+    # updates aborted at their deadline
+    overruns: int = 0
+    # refreshes skipped as an update was still running
+    skipped: int = 0
+
+
+def _is_active(data: dict[str, int | float]) -> bool:
+    """Test if telemetry shows that the heat pump is working."""
+    if data.get(_MODE_KEY, _MODE_STANDBY) != _MODE_STANDBY:
+        return True
+    return any(data.get(key) for key in _ACTIVITY_KEYS)
 
 
 class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]):
@@ -59,6 +156,37 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
         self._client = client
         update_interval = client.update_interval()
         self._pending_writes: dict[str, _PendingWrite] = {}
+        self._write_queue: dict[str, _QueuedWrite] = {}
+        # keys of values the device derives from each writable key
+        self._dependents: dict[str, tuple[str, ...]] = {
+            desc.key: desc.dependents
+            for desc in client.get_entity_descriptions()
+            if isinstance(desc, XtWritableEntityDescription) and desc.dependents
+        }
+        # incremented with each queued write, to detect bursts
+        self._write_generation = 0
+        # keys changed by the last update, None notifies all listeners
+        self._changed_keys: set[str] | None = None
+        self._next_full_dispatch = datetime.now(UTC)
+        self._refresh_success = True
+        # seconds during which the last values are shown after failed updates
+        self.stale_grace_period: float = DEFAULT_STALE_GRACE_PERIOD_S
+        # longest seconds between updates in standby, never shorter than the
+        # client's update interval
+        self.standby_update_interval: float = DEFAULT_STANDBY_UPDATE_INTERVAL_S
+        # time at which each key was last read from the device
+        self._read_at: dict[str, datetime] = {}
+        # time of the last successful read of the device
+        self._read_device_at: datetime | None = None
+        # freshness of each key as last dispatched to listeners
+        self._freshness: dict[str, _Freshness] = {}
+        self._breaker = CircuitBreaker(update_interval.total_seconds())
+        # set while an update waits for the client
+        self._update_running = False
+        self._cycle_stats = UpdateCycleStats()
+        self._set_base_interval(update_interval)
+        # update interval before alignment with the device refresh
+        self._poll_interval = update_interval
         super().__init__(
             hass=hass,
             logger=_LOGGER,
@@ -67,6 +195,14 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
             update_interval=update_interval,
         )
 
+    def _set_base_interval(self, base_interval: timedelta) -> None:
+        """Follow the update interval of the client."""
+        self._base_interval = base_interval
+        self._update_deadline_s = (
+            base_interval.total_seconds() * _UPDATE_DEADLINE_FRACTION
+        )
+        self._refresh_phase = RefreshPhase(base_interval.total_seconds())
+
     async def close(self) -> None:
         """Terminate usage."""
         _LOGGER.debug("Coordinator close")
@@ -75,14 +211,92 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
     async def _async_setup(self) -> None:
         """Set up the coordinator."""
         _LOGGER.debug("Coordinator _async_setup")
+        self._update_disabled_keys()
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated,
+                event_filter=self._is_entity_enable_change,
+            )
+        )
         await self._client.connect()
 
-    async def _async_update_data(self) -> dict[str, int | float]:  # noqa: C901
-        result: dict[str, int | float] = {}
+    @callback
+    def _is_entity_enable_change(
+        self, event_data: er.EventEntityRegistryUpdatedData
+    ) -> bool:
+        """Test if an entity registry update enables or disables an entity."""
+        return (
+            event_data["action"] == "update" and "disabled_by" in event_data["changes"]
+        )
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Handle entities being enabled or disabled."""
+        self._update_disabled_keys()
+
+    def _update_disabled_keys(self) -> None:
+        """Tell the client which entities are disabled."""
+        entry_id = self.config_entry.entry_id
+        registry = er.async_get(self.hass)
+        disabled_keys = {
+            entity_entry.unique_id.removeprefix(f"{entry_id}-")
+            for entity_entry in er.async_entries_for_config_entry(registry, entry_id)
+            if entity_entry.disabled
+        }
+        self._client.set_disabled_keys(disabled_keys)
+
+    @property
+    def cycle_stats(self) -> UpdateCycleStats:
+        """Return counters of updates which did not run as scheduled."""
+        return self._cycle_stats
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the state of updates and of the client for diagnostics."""
+        return {
+            "update_interval_s": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "last_update_success": self.last_update_success,
+            "cycle_stats": asdict(self._cycle_stats),
+            "pending_writes": sorted(self._pending_writes),
+            "client": self._client.get_diagnostics(),
+        }
+
+    async def async_refresh(self) -> None:
+        """Refresh data, unless an update is still running.
+
+        Refreshes would otherwise wait for the running update and start
+        right after it, stacking updates on a slow connection.
+        """
+        if self._update_running:
+            self._cycle_stats.skipped += 1
+            _LOGGER.debug("Skipping refresh, an update is still running")
+            return
+        await super().async_refresh()
+
+    async def _async_update_data(self) -> dict[str, int | float]:
+        self._update_running = True
+        try:
+            return await self._async_update()
+        finally:
+            self._update_running = False
+
+    async def _async_update(self) -> dict[str, int | float]:  # noqa: C901
+        # clients may only deliver the part of the data which was due for an
+        # update, so merge fresh values into the previously known ones.
+        previous: dict[str, int | float] = self.data or {}
+        result = dict(previous)
+        self._changed_keys = None
         try:
             _LOGGER.debug("Coordinator requesting new data")
-            client_data = await self._client.async_get_data()
+            polled_at = time.monotonic()
+            client_data = await self._async_get_client_data()
+            now = self._read_device_at = datetime.now(UTC)
             for key, value in client_data.items():
+                self._read_at[key] = now
                 pending_write = self._is_blocked(key)
                 if pending_write is not None:
                     result[key] = pending_write
@@ -98,6 +312,10 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
                 translation_key="modbus_read_busy_error",
             ) from err
         except XthermaRestBusyError as err:
+            # wait until requests are possible again
+            self.update_interval = self._client.next_update_interval(
+                self._poll_interval
+            )
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="rest_read_busy_error",
@@ -112,6 +330,11 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
                 translation_domain=DOMAIN,
                 translation_key="not_connected_error",
             ) from err
+        except XthermaDeviceOfflineError as err:
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="device_offline_error",
+            ) from err
         except XthermaRestApiError as err:
             raise UpdateFailed(
                 translation_domain=DOMAIN,
@@ -141,6 +364,9 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
                     "error": str(err),
                 },
             ) from err
+        self._changed_keys = self._get_changed_keys(previous, result)
+        self._record_refresh(polled_at, previous, client_data)
+        self._adapt_update_interval(previous, result)
         _LOGGER.debug(
             "coordinator processed %d/%d values",
             len(result),
@@ -148,17 +374,189 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
         )
         return result
 
+    async def _async_get_client_data(self) -> dict[str, int | float]:
+        """Poll the client, only probing the device while it is offline."""
+        breaker = self._breaker
+        if breaker.is_open and not breaker.probe_due():
+            raise XthermaDeviceOfflineError
+        deadline = asyncio.timeout(self._update_deadline_s)
+        try:
+            async with deadline:
+                if breaker.is_open:
+                    _LOGGER.debug("Probing offline device")
+                    await self._client.async_probe()
+                    breaker.record_success()
+                client_data = await self._client.async_get_data()
+        except TimeoutError as err:
+            breaker.record_failure()
+            if not deadline.expired():
+                raise
+            self._cycle_stats.overruns += 1
+            _LOGGER.debug("Update aborted after %.0f seconds", self._update_deadline_s)
+            raise XthermaTimeoutError from err
+        except (XthermaModbusBusyError, XthermaRestBusyError):
+            # busy devices do respond, so they do not count as failures
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        return client_data
+
+    def _get_changed_keys(
+        self,
+        previous: dict[str, int | float],
+        result: dict[str, int | float],
+    ) -> set[str] | None:
+        """Return the keys whose values or freshness changed.
+
+        Returns None if a full dispatch is due.
+        """
+        freshness_changed = self._get_freshness_changes(update_success=True)
+        now = datetime.now(UTC)
+        if now >= self._next_full_dispatch:
+            self._next_full_dispatch = now + timedelta(
+                seconds=_FULL_DISPATCH_INTERVAL_S
+            )
+            return None
+        changed = {key for key, value in result.items() if previous.get(key) != value}
+        return changed | freshness_changed
+
+    def _record_refresh(
+        self,
+        polled_at: float,
+        previous: dict[str, int | float],
+        client_data: dict[str, int | float],
+    ) -> None:
+        """Tell the refresh phase if the device refreshed since the last poll."""
+        values = {key: client_data[key] for key in _REFRESH_KEYS if key in client_data}
+        if not values:
+            # telemetry was not read
+            return
+        changed = any(previous.get(key) != value for key, value in values.items())
+        self._refresh_phase.record_poll(polled_at, changed=changed)
+
+    def _adapt_update_interval(
+        self,
+        previous: dict[str, int | float],
+        result: dict[str, int | float],
+    ) -> None:
+        """Poll at the client's rate while active, back off in standby.
+
+        In standby, the interval doubles with each update up to the
+        configured standby interval. Any change of the operating state also
+        polls at the client's rate, to follow transitions closely. At the
+        client's rate, polls are aligned with the refresh of device values.
+        """
+        base_interval = self._client.update_interval()
+        if base_interval != self._base_interval:
+            # e.g. more clients share a rate limit
+            _LOGGER.debug("Base update interval now %s", base_interval)
+            self._set_base_interval(base_interval)
+        if (
+            _is_active(result)
+            or _is_active(previous)
+            or result.get(_MODE_KEY) != previous.get(_MODE_KEY)
+        ):
+            poll_interval = base_interval
+        else:
+            standby_interval = max(
+                base_interval, timedelta(seconds=self.standby_update_interval)
+            )
+            poll_interval = min(self._poll_interval * 2, standby_interval)
+        if poll_interval != self._poll_interval:
+            _LOGGER.debug("Update interval now %s", poll_interval)
+            self._poll_interval = poll_interval
+        if poll_interval == base_interval:
+            update_interval = timedelta(seconds=self._refresh_phase.next_delay())
+        else:
+            # polls are too rare to follow the refresh
+            self._refresh_phase.reset()
+            update_interval = poll_interval
+        self.update_interval = self._client.next_update_interval(update_interval)
+
+    def _get_freshness(self, key: str, *, update_success: bool) -> _Freshness:
+        """Classify the age of the value of a key."""
+        age = self.data_age(key)
+        if age is None:
+            return _Freshness.EXPIRED
+        if not update_success:
+            return self._get_failed_freshness(key)
+        # in standby, polls may be less frequent than the client's period
+        period = max(self._client.get_update_period(key), self._poll_interval)
+        max_age = period.total_seconds() * _STALE_UPDATE_PERIODS
+        if age <= max_age:
+            return _Freshness.FRESH
+        # the grace period starts when the value became stale
+        if age <= max_age + self.stale_grace_period:
+            return _Freshness.STALE
+        return _Freshness.EXPIRED
+
+    def _get_failed_freshness(self, key: str) -> _Freshness:
+        """Classify the value of a key while the device cannot be read."""
+        # the grace period starts when the device could no longer be read
+        read_device_at = self._read_device_at or self._read_at[key]
+        failing_s = (datetime.now(UTC) - read_device_at).total_seconds()
+        if not self.stale_grace_period or failing_s > self.stale_grace_period:
+            # without grace period, failed updates expire all values
+            return _Freshness.EXPIRED
+        missed = failing_s / self._poll_interval.total_seconds()
+        if missed >= _STALE_MISSED_UPDATES:
+            return _Freshness.STALE
+        return _Freshness.FRESH
+
+    def _get_freshness_changes(self, *, update_success: bool) -> set[str]:
+        """Return the keys whose freshness changed since the last dispatch."""
+        freshness = {
+            key: self._get_freshness(key, update_success=update_success)
+            for key in self._read_at
+        }
+        changed = {
+            key for key, value in freshness.items() if self._freshness.get(key) != value
+        }
+        self._freshness = freshness
+        return changed
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Notify listeners whose values expired during failed updates."""
+        previous_success = self._refresh_success
+        self._refresh_success = self.last_update_success
+        if self.last_update_success:
+            return
+        self._changed_keys = self._get_freshness_changes(update_success=False)
+        # listeners are only notified about the first of several failed
+        # updates, so notify them about further changes ourselves
+        if not previous_success and self._changed_keys:
+            self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners whose keys changed with the last update.
+
+        All listeners are notified if a full dispatch is due.
+        """
+        changed_keys = self._changed_keys
+        self._changed_keys = None
+        if changed_keys is None:
+            super().async_update_listeners()
+            return
+        _LOGGER.debug("dispatching %d changed values", len(changed_keys))
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_keys:
+                update_callback()
+
     def get_entity_descriptions(self) -> list[EntityDescription]:
         """Get all entity descriptions."""
         if self._client is not None:
             return self._client.get_entity_descriptions()
         return []
 
-    def _block_for(self, key: str, seconds: int, value: int | float) -> None:
-        """Block reads for a specific register for N seconds."""
-        _LOGGER.debug("Block reads of key %s for %d seconds", key, seconds)
+    def _block_until(self, key: str, expires: float, value: int | float) -> None:
+        """Block reads for a specific register until the given monotonic time."""
+        _LOGGER.debug("Block reads of key %s until %.1f", key, expires)
         self._pending_writes[key] = _PendingWrite(
-            blocked_until=datetime.now(UTC) + timedelta(seconds=seconds),
+            expires=expires,
             value=value,
         )
 
@@ -171,20 +569,189 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
         pending = self._pending_writes.get(key)
         if pending is None:
             return None
-        now = datetime.now(UTC)
-        if now > pending.blocked_until:
-            # block time expired, delete key
-            self._pending_writes.pop(key)
+        if time.monotonic() > pending.expires:
+            # block time expired, the write stays pending until confirmed
             return None
         # key is actually blocked
         return pending.value
 
+    async def _async_flush_writes(self) -> None:
+        """Send queued writes once a burst of writes ended."""
+        for _ in range(int(_WRITE_MAX_DELAY_S / _WRITE_DEBOUNCE_S)):
+            generation = self._write_generation
+            await asyncio.sleep(_WRITE_DEBOUNCE_S)
+            if generation == self._write_generation:
+                break
+        queued = list(self._write_queue.values())
+        self._write_queue = {}
+        _LOGGER.debug("Writing %d queued values", len(queued))
+        try:
+            errors = await self._client.async_put_data_many(
+                [(write.desc, write.value) for write in queued]
+            )
+        except Exception as err:  # noqa: BLE001
+            errors = [err] * len(queued)
+        # one settle window for all values written together
+        expires = time.monotonic() + _WRITE_SETTLE_TIME_S
+        written: list[str] = []
+        for write, error in zip(queued, errors, strict=True):
+            for result in write.results:
+                if result.done():
+                    # the caller was cancelled while the write was queued
+                    continue
+                if error is not None:
+                    result.set_exception(error)
+                else:
+                    result.set_result(None)
+            if error is None:
+                self._block_until(write.desc.key, expires, write.value)
+                written.append(write.desc.key)
+        if written:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_confirm_writes(written), "xtherma_fp confirm"
+            )
+
+    async def _async_confirm_writes(self, keys: list[str]) -> None:
+        """Read back written values until the device reports them."""
+        pending = {key: self._pending_writes[key] for key in keys}
+        values: dict[str, int | float] = {}
+        for delay in _WRITE_CONFIRM_DELAYS_S:
+            await asyncio.sleep(delay)
+            # drop keys written again meanwhile, which are confirmed anew
+            keys = [
+                key for key in keys if self._pending_writes.get(key) is pending[key]
+            ]
+            if not keys:
+                return
+            try:
+                read = await self._client.async_get_values(keys)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Reading back written values failed: %s", err)
+                continue
+            values |= read
+            keys = self._confirm_writes(keys, read)
+            if not keys:
+                return
+        keys = [key for key in keys if self._pending_writes.get(key) is pending[key]]
+        self._reject_writes(keys, values)
+
+    def _confirm_writes(
+        self, keys: list[str], values: dict[str, int | float]
+    ) -> list[str]:
+        """Clear pending writes the device confirmed, return unconfirmed keys."""
+        confirmed: dict[str, int | float] = {}
+        for key in keys:
+            value = values.get(key)
+            if value is not None and math.isclose(
+                value, self._pending_writes[key].value, abs_tol=_WRITE_CONFIRM_TOLERANCE
+            ):
+                self._pending_writes.pop(key)
+                confirmed[key] = value
+        if confirmed:
+            _LOGGER.debug("Device confirmed %s", confirmed)
+            self._async_apply_values(confirmed)
+            dependents = {
+                dependent
+                for key in confirmed
+                for dependent in self._dependents.get(key, ())
+            }
+            if dependents:
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self._async_read_dependents(sorted(dependents)),
+                    "xtherma_fp dependents",
+                )
+        return [key for key in keys if key not in confirmed]
+
+    async def _async_read_dependents(self, keys: list[str]) -> None:
+        """Read values derived from confirmed writes until they change."""
+        for delay in _DEPENDENTS_READ_DELAYS_S:
+            await asyncio.sleep(delay)
+            try:
+                values = await self._client.async_get_values(keys)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Reading derived values failed: %s", err)
+                continue
+            if not values:
+                # the client cannot read single values
+                return
+            now = datetime.now(UTC)
+            for key in values:
+                self._read_at[key] = now
+            previous = self.data or {}
+            changed = {
+                key: value
+                for key, value in values.items()
+                if previous.get(key) != value and self._is_blocked(key) is None
+            }
+            if changed:
+                _LOGGER.debug("Derived values changed %s", changed)
+                self._async_apply_values(changed)
+                return
+
+    def _reject_writes(self, keys: list[str], values: dict[str, int | float]) -> None:
+        """Clear pending writes the device never confirmed."""
+        # show the values the device actually uses
+        rejected: dict[str, int | float] = {}
+        rejected_level, unconfirmed_level = logging.ERROR, logging.WARNING
+        if self._client.is_failed_over:
+            # the device is not read directly, so do not report it
+            rejected_level = unconfirmed_level = logging.DEBUG
+        for key in keys:
+            pending = self._pending_writes.pop(key)
+            value = values.get(key)
+            if value is None:
+                # never read back, the next update shows the device's value
+                _LOGGER.log(
+                    unconfirmed_level,
+                    'Could not confirm value %s for "%s"',
+                    pending.value,
+                    key,
+                )
+                continue
+            _LOGGER.log(
+                rejected_level,
+                'Device did not accept value %s for "%s"',
+                pending.value,
+                key,
+            )
+            rejected[key] = value
+        if rejected:
+            self._async_apply_values(rejected)
+
+    @callback
+    def _async_apply_values(self, values: dict[str, int | float]) -> None:
+        """Update single values and notify their listeners."""
+        if self.data is None:
+            return
+        self.data = {**self.data, **values}
+        self._changed_keys = set(values)
+        self.async_update_listeners()
+
     async def async_write(self, entity: Entity, value: int | float) -> None:
-        """Add a write request to the queue."""
+        """Add a write request to the queue and wait until it was sent.
+
+        If the value is replaced by a later write before it was sent, this
+        waits for the later write instead.
+        """
         desc = entity.entity_description
+        result: asyncio.Future[None] = self.hass.loop.create_future()
+        self._write_generation += 1
+        queued = self._write_queue.get(desc.key)
+        if queued is not None:
+            _LOGGER.debug('Replacing queued value %s of "%s"', queued.value, desc.key)
+            queued.value = value
+            queued.results.append(result)
+        else:
+            if not self._write_queue:
+                self.config_entry.async_create_background_task(
+                    self.hass, self._async_flush_writes(), "xtherma_fp write"
+                )
+            self._write_queue[desc.key] = _QueuedWrite(
+                desc=desc, value=value, results=[result]
+            )
         try:
-            await self._client.async_put_data(desc=desc, value=value)
-            self._block_for(key=desc.key, seconds=_WRITE_SETTLE_TIME_S, value=value)
+            await result
         except XthermaReadOnlyError as err:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -210,13 +777,52 @@ class XthermaDataUpdateCoordinator(DataUpdateCoordinator[dict[str, int | float]]
                     "entity_id": entity.entity_id,
                 },
             ) from err
+        except XthermaNotConnectedError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="not_connected_error",
+            ) from err
+        except (XthermaTimeoutError, TimeoutError) as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="timeout_error",
+            ) from err
+        except XthermaError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="general_error",
+                translation_placeholders={
+                    "error": str(err),
+                },
+            ) from err
+
+    def data_age(self, key: str) -> float | None:
+        """Return seconds since the value of a key was read, None if never."""
+        read_at = self._read_at.get(key)
+        if read_at is None:
+            return None
+        return (datetime.now(UTC) - read_at).total_seconds()
+
+    def is_available(self, key: str) -> bool:
+        """Test if the value of a key is recent enough to be shown.
+
+        Values are kept while reads fail, but become unavailable once the
+        grace period expired.
+        """
+        freshness = self._get_freshness(key, update_success=self.last_update_success)
+        return freshness is not _Freshness.EXPIRED
+
+    def get_stale_read_time(self, key: str) -> datetime | None:
+        """Return when a stale value was read, None if the value is fresh."""
+        freshness = self._get_freshness(key, update_success=self.last_update_success)
+        if freshness is not _Freshness.STALE:
+            return None
+        return self._read_at[key]
 
     def read_value(self, key: str) -> int | float | None:
         """Read a value from us."""
         if self.data is None:
             return None
-        if not self.last_update_success:
-            return None
         value = self.data.get(key)
         if value is None:
             msg = "Missing data in coordinator key=%s"
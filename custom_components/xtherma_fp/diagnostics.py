@@ -0,0 +1,32 @@
+"""Diagnostics support for the Xtherma integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY, CONF_HOST
+
+from .const import CONF_SERIAL_NUMBER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import XthermaConfigEntry
+
+# entry data identifying the heat pump or granting access to it
+_TO_REDACT = {CONF_API_KEY, CONF_HOST, CONF_SERIAL_NUMBER}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: XthermaConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    del hass
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, _TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": entry.runtime_data.coordinator.get_diagnostics(),
+    }
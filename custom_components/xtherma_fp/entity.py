@@ -1,6 +1,7 @@
 "Xtherma parent entity class."
 
 import logging
+from typing import Any
 
 from homeassistant.helpers.device_registry import (
     DeviceInfo,
@@ -10,7 +11,7 @@ from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
 
-from .const import EXTRA_STATE_ATTRIBUTE_PARAMETER
+from .const import EXTRA_STATE_ATTRIBUTE_LAST_READ, EXTRA_STATE_ATTRIBUTE_PARAMETER
 from .coordinator import XthermaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,7 +29,8 @@ class XthermaCoordinatorEntity(CoordinatorEntity[XthermaDataUpdateCoordinator]):
         description: EntityDescription,
     ) -> None:
         """Initialize the Xtherma coordinator entity."""
-        super().__init__(coordinator)
+        # the key lets the coordinator notify us about changes of our value only
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
         self.xt_description = description
         self._attr_has_entity_name = True
@@ -37,7 +39,20 @@ class XthermaCoordinatorEntity(CoordinatorEntity[XthermaDataUpdateCoordinator]):
         self._attr_unique_id = (
             f"{self.coordinator.config_entry.entry_id}-{description.key}"
         )
-        self._attr_extra_state_attributes = {
+        self.translation_key = description.key
+
+    @property
+    def available(self) -> bool:
+        """Return if our value was read recently enough."""
+        return self.coordinator.is_available(self.xt_description.key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return our parameter, and when a stale value was read."""
+        attributes: dict[str, Any] = {
             EXTRA_STATE_ATTRIBUTE_PARAMETER: self.xt_description.key,
         }
-        self.translation_key = description.key
+        read_at = self.coordinator.get_stale_read_time(self.xt_description.key)
+        if read_at is not None:
+            attributes[EXTRA_STATE_ATTRIBUTE_LAST_READ] = read_at.isoformat()
+        return attributes
@@ -37,6 +37,11 @@ from homeassistant.const import (
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.typing import StateType
 
+from .const import (
+    MODBUS_SETTINGS_UPDATE_PERIOD_S,
+    MODBUS_TELEMETRY_UPDATE_PERIOD_S,
+)
+
 
 @dataclass(kw_only=True, frozen=True)
 class XtBinaryEntityDescription:
@@ -45,10 +50,20 @@ class XtBinaryEntityDescription:
     icon_provider: Callable[[bool | None], str] | None = None
 
 
+@dataclass(kw_only=True, frozen=True)
+class XtWritableEntityDescription:
+    """An entity whose value can be written."""
+
+    # keys of values the device derives from this one, they are read again
+    # once the device confirmed a written value
+    dependents: tuple[str, ...] = ()
+
+
 @dataclass(kw_only=True, frozen=True)
 class XtSwitchEntityDescription(
     SwitchEntityDescription,
     XtBinaryEntityDescription,
+    XtWritableEntityDescription,
 ):
     """A switchable input entity."""
 
@@ -70,14 +85,21 @@ class XtNumericEntityDescription:
 
 
 @dataclass(kw_only=True, frozen=True)
-class XtSelectEntityDescription(SelectEntityDescription):
+class XtSelectEntityDescription(
+    SelectEntityDescription,
+    XtWritableEntityDescription,
+):
     """A selectable state input entity."""
 
     icon_provider: Callable[[str | None], str] | None = None
 
 
 @dataclass(kw_only=True, frozen=True)
-class XtNumberEntityDescription(NumberEntityDescription, XtNumericEntityDescription):
+class XtNumberEntityDescription(
+    NumberEntityDescription,
+    XtNumericEntityDescription,
+    XtWritableEntityDescription,
+):
     """A numeric input entity."""
 
 
@@ -230,27 +252,47 @@ _icon_hot_water = "mdi:water-boiler"
 _icon_heating = "mdi:heating-coil"
 _icon_cooling = "mdi:snowflake"
 
+# target values derived by the device from settings
+_dependents_heating_1 = ("h_target", "h1_target")
+_dependents_heating_2 = ("h_target", "h2_target")
+_dependents_cooling_1 = ("c_target", "c1_target")
+_dependents_cooling_2 = ("c_target", "c2_target")
+_dependents_hot_water = ("hw_target",)
+_dependents_operating_mode = (
+    "mode",
+    *_dependents_heating_1,
+    "h2_target",
+    *_dependents_cooling_1,
+    "c2_target",
+    *_dependents_hot_water,
+)
+
 #
 # Settings
 #
 _sensor_001 = XtSwitchEntityDescription(
     key="001",
+    dependents=_dependents_operating_mode,
 )
 _sensor_002 = XtSelectEntityDescription(
     key="002",
+    dependents=_dependents_operating_mode,
     options=_002_options,
     icon_provider=_002_icon,
 )
 _sensor_003 = XtSwitchEntityDescription(
     key="003",
+    dependents=_dependents_hot_water,
     icon=_icon_hot_water,
 )
 _sensor_310 = XtSwitchEntityDescription(
     key="310",
+    dependents=_dependents_heating_1,
     icon=_icon_heating,
 )
 _sensor_311 = XtNumberEntityDescription(
     key="311",
+    dependents=_dependents_heating_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -261,6 +303,7 @@ _sensor_311 = XtNumberEntityDescription(
 )
 _sensor_312 = XtNumberEntityDescription(
     key="312",
+    dependents=_dependents_heating_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -271,6 +314,7 @@ _sensor_312 = XtNumberEntityDescription(
 )
 _sensor_315 = XtNumberEntityDescription(
     key="315",
+    dependents=_dependents_heating_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -281,6 +325,7 @@ _sensor_315 = XtNumberEntityDescription(
 )
 _sensor_316 = XtNumberEntityDescription(
     key="316",
+    dependents=_dependents_heating_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -291,6 +336,7 @@ _sensor_316 = XtNumberEntityDescription(
 )
 _sensor_320 = XtNumberEntityDescription(
     key="320",
+    dependents=_dependents_heating_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     mode=NumberMode.BOX,
@@ -301,10 +347,12 @@ _sensor_320 = XtNumberEntityDescription(
 )
 _sensor_350 = XtSwitchEntityDescription(
     key="350",
+    dependents=_dependents_cooling_1,
     icon=_icon_cooling,
 )
 _sensor_351 = XtNumberEntityDescription(
     key="351",
+    dependents=_dependents_cooling_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -315,6 +363,7 @@ _sensor_351 = XtNumberEntityDescription(
 )
 _sensor_352 = XtNumberEntityDescription(
     key="352",
+    dependents=_dependents_cooling_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -325,6 +374,7 @@ _sensor_352 = XtNumberEntityDescription(
 )
 _sensor_355 = XtNumberEntityDescription(
     key="355",
+    dependents=_dependents_cooling_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -335,6 +385,7 @@ _sensor_355 = XtNumberEntityDescription(
 )
 _sensor_356 = XtNumberEntityDescription(
     key="356",
+    dependents=_dependents_cooling_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -345,6 +396,7 @@ _sensor_356 = XtNumberEntityDescription(
 )
 _sensor_360 = XtNumberEntityDescription(
     key="360",
+    dependents=_dependents_cooling_1,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -355,10 +407,12 @@ _sensor_360 = XtNumberEntityDescription(
 )
 _sensor_410 = XtSwitchEntityDescription(
     key="410",
+    dependents=_dependents_heating_2,
     icon=_icon_heating,
 )
 _sensor_411 = XtNumberEntityDescription(
     key="411",
+    dependents=_dependents_heating_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -369,6 +423,7 @@ _sensor_411 = XtNumberEntityDescription(
 )
 _sensor_412 = XtNumberEntityDescription(
     key="412",
+    dependents=_dependents_heating_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -379,6 +434,7 @@ _sensor_412 = XtNumberEntityDescription(
 )
 _sensor_415 = XtNumberEntityDescription(
     key="415",
+    dependents=_dependents_heating_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -389,6 +445,7 @@ _sensor_415 = XtNumberEntityDescription(
 )
 _sensor_416 = XtNumberEntityDescription(
     key="416",
+    dependents=_dependents_heating_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -399,6 +456,7 @@ _sensor_416 = XtNumberEntityDescription(
 )
 _sensor_420 = XtNumberEntityDescription(
     key="420",
+    dependents=_dependents_heating_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -409,10 +467,12 @@ _sensor_420 = XtNumberEntityDescription(
 )
 _sensor_450 = XtSwitchEntityDescription(
     key="450",
+    dependents=_dependents_cooling_2,
     icon=_icon_cooling,
 )
 _sensor_451 = XtNumberEntityDescription(
     key="451",
+    dependents=_dependents_cooling_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -423,6 +483,7 @@ _sensor_451 = XtNumberEntityDescription(
 )
 _sensor_452 = XtNumberEntityDescription(
     key="452",
+    dependents=_dependents_cooling_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -433,6 +494,7 @@ _sensor_452 = XtNumberEntityDescription(
 )
 _sensor_455 = XtNumberEntityDescription(
     key="455",
+    dependents=_dependents_cooling_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -443,6 +505,7 @@ _sensor_455 = XtNumberEntityDescription(
 )
 _sensor_456 = XtNumberEntityDescription(
     key="456",
+    dependents=_dependents_cooling_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -453,6 +516,7 @@ _sensor_456 = XtNumberEntityDescription(
 )
 _sensor_460 = XtNumberEntityDescription(
     key="460",
+    dependents=_dependents_cooling_2,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature,
@@ -463,6 +527,7 @@ _sensor_460 = XtNumberEntityDescription(
 )
 _sensor_501 = XtNumberEntityDescription(
     key="501",
+    dependents=_dependents_hot_water,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature_target_water,
@@ -473,6 +538,7 @@ _sensor_501 = XtNumberEntityDescription(
 )
 _sensor_522 = XtNumberEntityDescription(
     key="522",
+    dependents=_dependents_hot_water,
     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
     device_class=NumberDeviceClass.TEMPERATURE,
     icon=_icon_temperature_target_water,
@@ -952,6 +1018,14 @@ class ModbusRegisterSet:
         | None
     ]
 
+    # period in seconds after which this set is read again from the device
+    update_period_s: int = MODBUS_TELEMETRY_UPDATE_PERIOD_S
+
+    @property
+    def last_reg(self) -> int:
+        """Last register of this set."""
+        return self.base + len(self.descriptors) - 1
+
 
 _MODBUS_SETTINGS_GENERAL = ModbusRegisterSet(
     base=0,
@@ -960,6 +1034,7 @@ _MODBUS_SETTINGS_GENERAL = ModbusRegisterSet(
         _sensor_002,
         _sensor_003,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_HEATING_CURVE_1 = ModbusRegisterSet(
@@ -972,6 +1047,7 @@ _MODBUS_SETTINGS_HEATING_CURVE_1 = ModbusRegisterSet(
         _sensor_316,
         _sensor_320,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_COOLING_CURVE_1 = ModbusRegisterSet(
@@ -984,6 +1060,7 @@ _MODBUS_SETTINGS_COOLING_CURVE_1 = ModbusRegisterSet(
         _sensor_356,
         _sensor_360,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_HEATING_CURVE_2 = ModbusRegisterSet(
@@ -996,6 +1073,7 @@ _MODBUS_SETTINGS_HEATING_CURVE_2 = ModbusRegisterSet(
         _sensor_416,
         _sensor_420,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_COOLING_CURVE_2 = ModbusRegisterSet(
@@ -1008,6 +1086,7 @@ _MODBUS_SETTINGS_COOLING_CURVE_2 = ModbusRegisterSet(
         _sensor_456,
         _sensor_460,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_HOT_WATER = ModbusRegisterSet(
@@ -1016,6 +1095,7 @@ _MODBUS_SETTINGS_HOT_WATER = ModbusRegisterSet(
         _sensor_501,
         _sensor_522,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_SETTINGS_NETWORK = ModbusRegisterSet(
@@ -1027,6 +1107,7 @@ _MODBUS_SETTINGS_NETWORK = ModbusRegisterSet(
         _sensor_813,
         _sensor_815,
     ],
+    update_period_s=MODBUS_SETTINGS_UPDATE_PERIOD_S,
 )
 
 _MODBUS_TELEMETRY_GENERAL = ModbusRegisterSet(
@@ -1145,9 +1226,8 @@ MODBUS_ENTITY_DESCRIPTIONS: list[ModbusRegisterSet] = [
 ]
 
 
-# The modbus protocol only allows reading up to 125 registers at once.
-# Therefore, we need to split the entire register range into
-# manageable sub ranges.
+# Registers which are read in one call. The ranges are planned by the
+# Modbus client from MODBUS_ENTITY_DESCRIPTIONS.
 @dataclass(kw_only=True, frozen=True)
 class ModbusRegisterRange:
     """Definition of a register range which is read in one call."""
@@ -1159,7 +1239,7 @@ class ModbusRegisterRange:
     # a register in this range which cannot ever be empty
     # this is used to detect bogus reads where the device sends us
     # empty data instead of, for instance, a busy response.
-    non_empty_reg: int
+    non_empty_reg: int | None = None
 
     @property
     def length(self) -> int:
@@ -1167,13 +1247,19 @@ class ModbusRegisterRange:
         return self.last_reg - self.first_reg + 1
 
 
-MODBUS_REGISTER_RANGES: list[ModbusRegisterRange] = [
-    ModbusRegisterRange(first_reg=0, last_reg=71, non_empty_reg=50),
-    ModbusRegisterRange(first_reg=100, last_reg=193, non_empty_reg=100),
-]
+# Keys of registers which cannot ever be zero. Read ranges containing one of
+# them use it to detect empty data.
+MODBUS_NON_EMPTY_KEYS: frozenset[str] = frozenset(
+    {
+        _sensor_501.key,
+        _sensor_controller_v.key,
+    }
+)
 
 # The total size of the modbus register space used.
-MODBUS_REGISTER_SIZE = MODBUS_REGISTER_RANGES[-1].last_reg + 1
+MODBUS_REGISTER_SIZE = (
+    max(reg_desc.last_reg for reg_desc in MODBUS_ENTITY_DESCRIPTIONS) + 1
+)
 
 ENTITY_DESCRIPTIONS: list[EntityDescription] = [
     # ------- general system state
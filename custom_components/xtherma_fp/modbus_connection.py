@@ -0,0 +1,257 @@
+"""Long-lived, shared connections to Modbus TCP servers."""
+
+import asyncio
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum, StrEnum
+
+from .const import MODBUS_TIMEOUT_S
+from .vendor.pymodbus import AsyncModbusTcpClient
+from .xtherma_client_common import XthermaNotConnectedError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reconnect delays in seconds grow exponentially between these bounds.
+_RECONNECT_DELAY_MIN_S = 1.0
+_RECONNECT_DELAY_MAX_S = 300.0
+
+# Reconnect delays are randomized by this fraction, so clients losing
+# their connection at the same time do not reconnect at the same time.
+_RECONNECT_JITTER = 0.2
+
+# Requests in flight on one connection. Several devices behind one gateway
+# share these, waiting requests are served by priority, devices take turns.
+_MAX_REQUESTS_IN_FLIGHT = 4
+
+
+class ModbusConnectionState(StrEnum):
+    """Health of a Modbus connection."""
+
+    # connected, last request succeeded
+    CONNECTED = "connected"
+    # connected, but the last request failed
+    DEGRADED = "degraded"
+    # not connected, reconnecting in background
+    DOWN = "down"
+
+
+class RequestPriority(IntEnum):
+    """Priority of waiting requests, lower values are served first."""
+
+    # writes requested by the user
+    WRITE = 0
+    # reads confirming written values
+    CONFIRM = 1
+    # regular polls of frequently updated registers
+    TELEMETRY = 2
+    # regular polls of rarely updated registers
+    SETTINGS = 3
+
+
+def reconnect_delay(attempt: int) -> float:
+    """Return the delay in seconds before the given reconnect attempt."""
+    delay = min(_RECONNECT_DELAY_MAX_S, _RECONNECT_DELAY_MIN_S * 2**attempt)
+    return delay * random.uniform(1 - _RECONNECT_JITTER, 1 + _RECONNECT_JITTER)  # noqa: S311
+
+
+class _FairSlots:
+    """Limit concurrent requests, granting free slots by priority.
+
+    Devices waiting with requests of the same priority are served in turn.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._in_use = 0
+        # waiting requests per priority and device, and the order in which
+        # devices are served per priority
+        self._waiters: dict[RequestPriority, dict[int, deque[asyncio.Future[None]]]] = {
+            priority: {} for priority in RequestPriority
+        }
+        self._turns: dict[RequestPriority, deque[int]] = {
+            priority: deque() for priority in RequestPriority
+        }
+
+    def _has_waiters(self) -> bool:
+        return any(self._turns.values())
+
+    async def acquire(self, device_id: int, priority: RequestPriority) -> None:
+        if self._in_use < self._limit and not self._has_waiters():
+            self._in_use += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiters = self._waiters[priority]
+        if device_id not in waiters:
+            waiters[device_id] = deque()
+            self._turns[priority].append(device_id)
+        waiters[device_id].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was already handed to us, pass it on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        for priority in RequestPriority:
+            turns = self._turns[priority]
+            waiters = self._waiters[priority]
+            while turns:
+                device_id = turns.popleft()
+                device_waiters = waiters[device_id]
+                waiter = device_waiters.popleft()
+                if device_waiters:
+                    turns.append(device_id)
+                else:
+                    del waiters[device_id]
+                if not waiter.done():
+                    # hand our slot over to the waiting request
+                    waiter.set_result(None)
+                    return
+        self._in_use -= 1
+
+
+class ModbusConnection:
+    """Keep a connection to a Modbus TCP server.
+
+    The connection is established once and reconnected in background after
+    it was lost, so requests never wait for a TCP handshake. Requests fail
+    with XthermaNotConnectedError while the connection is down.
+
+    Several devices behind one gateway share the connection. Request
+    failures are tracked per device, so one unresponsive device does not
+    degrade the others.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """Class constructor."""
+        self._host = host
+        self._port = port
+        # reconnects are handled here, so disable those of pymodbus
+        self._client = AsyncModbusTcpClient(
+            host=host,
+            port=port,
+            timeout=float(MODBUS_TIMEOUT_S),
+            reconnect_delay=0,
+        )
+        # send requests without waiting for earlier responses
+        self._client.set_pipelined(True)
+        self._reconnect_task: asyncio.Task | None = None
+        # devices whose last request failed
+        self._failed_devices: set[int] = set()
+        self._slots = _FairSlots(_MAX_REQUESTS_IN_FLIGHT)
+
+    def get_state(self, device_id: int) -> ModbusConnectionState:
+        """Return health of the connection to a device."""
+        if not self._client.connected:
+            return ModbusConnectionState.DOWN
+        if device_id in self._failed_devices:
+            return ModbusConnectionState.DEGRADED
+        return ModbusConnectionState.CONNECTED
+
+    async def async_connect(self) -> None:
+        """Connect to the server if needed, waiting for the result."""
+        if self._client.connected:
+            return
+        if not await self._async_try_connect():
+            raise XthermaNotConnectedError
+
+    async def _async_try_connect(self) -> bool:
+        try:
+            _LOGGER.debug("connecting to %s:%d", self._host, self._port)
+            result = await self._client.connect()
+        except Exception:
+            _LOGGER.exception("connection error")
+            return False
+        _LOGGER.debug(
+            "connected client success = %s, connected = %s",
+            result,
+            self._client.connected,
+        )
+        if result:
+            self._failed_devices.clear()
+        return bool(result and self._client.connected)
+
+    def get_client(self) -> AsyncModbusTcpClient:
+        """Return the connected client.
+
+        Starts reconnecting in background if the connection is down.
+        """
+        if not self._client.connected:
+            if self._reconnect_task is None or self._reconnect_task.done():
+                _LOGGER.debug("not connected, reconnecting in background")
+                self._reconnect_task = asyncio.create_task(
+                    self._async_reconnect(), name="xtherma_fp modbus reconnect"
+                )
+            raise XthermaNotConnectedError
+        return self._client
+
+    async def _async_reconnect(self) -> None:
+        attempt = 0
+        while True:
+            delay = reconnect_delay(attempt)
+            _LOGGER.debug("reconnect attempt %d in %.1f seconds", attempt + 1, delay)
+            await asyncio.sleep(delay)
+            if await self._async_try_connect():
+                _LOGGER.info("Reconnected to %s:%d", self._host, self._port)
+                return
+            attempt += 1
+
+    @asynccontextmanager
+    async def request_slot(
+        self, device_id: int, priority: RequestPriority
+    ) -> AsyncIterator[None]:
+        """Wait for the turn of a device to send a request."""
+        await self._slots.acquire(device_id, priority)
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def record_success(self, device_id: int) -> None:
+        """Record a successful request to a device."""
+        self._failed_devices.discard(device_id)
+
+    def record_failure(self, device_id: int) -> None:
+        """Record a request to a device which failed due to communication errors."""
+        if device_id not in self._failed_devices:
+            _LOGGER.debug("connection to device %d degraded", device_id)
+        self._failed_devices.add(device_id)
+
+    def close(self) -> None:
+        """Stop reconnecting and close the connection."""
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        self._client.close()
+
+
+# Connections shared by all clients, keyed by host and port.
+_connections: dict[tuple[str, int], ModbusConnection] = {}
+_connection_users: dict[tuple[str, int], int] = {}
+
+
+def acquire_connection(host: str, port: int) -> ModbusConnection:
+    """Return the shared connection to a server, creating it if needed."""
+    key = (host, port)
+    connection = _connections.get(key)
+    if connection is None:
+        connection = _connections[key] = ModbusConnection(host, port)
+        _connection_users[key] = 0
+    _connection_users[key] += 1
+    return connection
+
+
+def release_connection(host: str, port: int) -> None:
+    """Release a shared connection, closing it when it is no longer used."""
+    key = (host, port)
+    if key not in _connections:
+        return
+    _connection_users[key] -= 1
+    if _connection_users[key] <= 0:
+        del _connection_users[key]
+        _connections.pop(key).close()
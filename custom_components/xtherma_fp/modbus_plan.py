@@ -0,0 +1,161 @@
+"""Read and decode planning for the Modbus client."""
+
+import struct
+from array import array
+from collections.abc import Buffer, Collection
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import SensorDeviceClass
+
+from .entity_descriptors import (
+    MODBUS_ENTITY_DESCRIPTIONS,
+    MODBUS_NON_EMPTY_KEYS,
+    ModbusRegisterRange,
+    ModbusRegisterSet,
+    XtNumericEntityDescription,
+    XtSensorEntityDescription,
+)
+from .xtherma_client_common import FACTOR_SCALES
+
+# Each register holds a 16 bit word.
+MODBUS_REGISTER_BYTES = 2
+
+# The modbus protocol only allows reading up to 125 registers at once.
+MODBUS_MAX_READ_COUNT = 125
+
+# Cost of an additional read request, expressed in registers. Each request
+# pays for headers, bus turnaround and gateway latency, which amounts to
+# transferring roughly this many registers. Gaps of unused registers
+# shorter than this are cheaper to read along than to skip.
+MODBUS_READ_REQUEST_COST = 30
+
+
+def plan_read_ranges(
+    reg_descs: list[ModbusRegisterSet],
+    disabled_keys: Collection[str] = (),
+    max_count: int = MODBUS_MAX_READ_COUNT,
+    request_cost: int = MODBUS_READ_REQUEST_COST,
+) -> list[ModbusRegisterRange]:
+    """Compute the cheapest set of register ranges covering all used registers.
+
+    Registers of disabled keys are not read. The cost of a plan is the number
+    of registers read plus request_cost for each range, no range may exceed
+    max_count registers.
+    """
+    keys: dict[int, str] = {}
+    for reg_desc in reg_descs:
+        for i, desc in enumerate(reg_desc.descriptors):
+            if desc is not None and desc.key not in disabled_keys:
+                keys[reg_desc.base + i] = desc.key
+    addresses = sorted(keys)
+    if not addresses:
+        return []
+
+    # cost[j] is the cost of reading addresses[:j], first[j] is the index
+    # of the first address of the last range in this optimal plan.
+    count = len(addresses)
+    cost = [0] * (count + 1)
+    first = [0] * (count + 1)
+    for j in range(1, count + 1):
+        last_reg = addresses[j - 1]
+        best_cost = -1
+        for i in range(j - 1, -1, -1):
+            length = last_reg - addresses[i] + 1
+            if length > max_count:
+                break
+            candidate = cost[i] + request_cost + length
+            if best_cost < 0 or candidate < best_cost:
+                best_cost = candidate
+                first[j] = i
+        cost[j] = best_cost
+
+    ranges: list[ModbusRegisterRange] = []
+    j = count
+    while j > 0:
+        i = first[j]
+        covered = addresses[i:j]
+        non_empty_reg = next(
+            (address for address in covered if keys[address] in MODBUS_NON_EMPTY_KEYS),
+            None,
+        )
+        ranges.append(
+            ModbusRegisterRange(
+                first_reg=covered[0],
+                last_reg=covered[-1],
+                non_empty_reg=non_empty_reg,
+            )
+        )
+        j = i
+    ranges.reverse()
+    return ranges
+
+
+# Read plan covering all registers.
+MODBUS_REGISTER_RANGES: list[ModbusRegisterRange] = plan_read_ranges(
+    MODBUS_ENTITY_DESCRIPTIONS
+)
+
+
+@dataclass(kw_only=True, frozen=True)
+class ModbusDecodePlan:
+    """Precompiled decoding of the registers of one register set.
+
+    The registers are unpacked in one go from a big endian register image,
+    which holds two bytes per register address. Keys, multipliers and
+    divisors are indexed by the same slot, one slot per decoded key.
+    """
+
+    keys: tuple[str, ...]
+    layout: struct.Struct
+    offset: int
+    multipliers: array
+    divisors: array
+
+    def decode(self, image: Buffer, result: dict[str, int | float]) -> None:
+        """Decode registers from the register image into result."""
+        for key, value, multiplier, divisor in zip(
+            self.keys,
+            self.layout.unpack_from(image, self.offset),
+            self.multipliers,
+            self.divisors,
+            strict=True,
+        ):
+            if divisor != 1:
+                result[key] = value * multiplier / divisor
+            else:
+                result[key] = value * multiplier
+
+
+def compile_decode_plan(
+    reg_desc: ModbusRegisterSet,
+    disabled_keys: Collection[str] = (),
+) -> ModbusDecodePlan:
+    """Compile the decoding of a register set, skipping disabled keys."""
+    keys: list[str] = []
+    # registers are big endian, unused and disabled ones are skipped as padding
+    layout = [">"]
+    multipliers = array("l")
+    divisors = array("l")
+    for desc in reg_desc.descriptors:
+        if desc is None or desc.key in disabled_keys:
+            layout.append("2x")
+            continue
+        keys.append(desc.key)
+        # two's complement for negative scalar values
+        signed = (
+            isinstance(desc, XtNumericEntityDescription)
+            and desc.device_class != SensorDeviceClass.ENUM
+        )
+        layout.append("h" if signed else "H")
+        multiplier, divisor = 1, 1
+        if isinstance(desc, XtSensorEntityDescription) and desc.factor:
+            multiplier, divisor = FACTOR_SCALES.get(desc.factor, (1, 1))
+        multipliers.append(multiplier)
+        divisors.append(divisor)
+    return ModbusDecodePlan(
+        keys=tuple(keys),
+        layout=struct.Struct("".join(layout)),
+        offset=reg_desc.base * MODBUS_REGISTER_BYTES,
+        multipliers=multipliers,
+        divisors=divisors,
+    )
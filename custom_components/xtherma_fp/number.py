@@ -62,10 +62,15 @@ class XthermaNumberEntity(XthermaCoordinatorEntity, NumberEntity):
         """Set value."""
         try:
             native_value = self._align_native_value_type(value)
-            await self.coordinator.async_write(self, value=native_value)
+            # show the value right away, while writes of a burst are debounced
             self._attr_native_value = native_value
             self.async_write_ha_state()
+            await self.coordinator.async_write(self, value=native_value)
         except HomeAssistantError:
+            # show the value last read from the device again
+            device_value = self.coordinator.read_value(self.entity_description.key)
+            if device_value is not None:
+                self._attr_native_value = self._align_native_value_type(device_value)
             self._attr_force_update = True
             self.async_write_ha_state()
             self._attr_force_update = False
@@ -0,0 +1,187 @@
+"""Align polls with the internal refresh of device values."""
+
+import logging
+import math
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+# Polls are aligned with the refresh once its time is known this precisely.
+# Refreshes are scheduled by Home Assistant with a precision of one second.
+_PRECISION_S = 2.0
+
+# Aligned polls happen this long after the expected refresh.
+_MARGIN_S = 1.0
+
+# The device clock may drift against ours, so the known refresh time becomes
+# less precise with each poll, and is learned again once too imprecise.
+_DRIFT_S = 0.05
+
+# Polls contradicting the known refresh time, after which it is learned again.
+_CONTRADICTIONS_LIMIT = 2
+
+
+class RefreshPhase:
+    """Learn when the device refreshes its values.
+
+    The device refreshes its values on its own tick, which is assumed to
+    match the poll period. The refresh is known to happen within a window,
+    which is initially the time between two polls. Probing polls in the
+    middle of the window halve it: if they see changed values, the refresh
+    happened before them, otherwise after them. Once the window is narrow,
+    polls happen just after each refresh.
+    """
+
+    def __init__(
+        self,
+        period_s: float,
+        precision_s: float = _PRECISION_S,
+        margin_s: float = _MARGIN_S,
+        drift_s: float = _DRIFT_S,
+    ) -> None:
+        """Class constructor."""
+        self._period_s = period_s
+        self._precision_s = precision_s
+        self._margin_s = margin_s
+        self._drift_s = drift_s
+        # monotonic time of the last poll
+        self._last_poll: float | None = None
+        # window of monotonic times within which the device refreshed, None
+        # while unknown
+        self._window: tuple[float, float] | None = None
+        # consecutive polls contradicting the window
+        self._contradictions = 0
+
+    @property
+    def is_locked(self) -> bool:
+        """Return if polls are aligned with the refresh."""
+        return (
+            self._window is not None
+            and self._window[1] - self._window[0] <= self._precision_s
+        )
+
+    def reset(self) -> None:
+        """Forget the refresh time, e.g. after polls were paused."""
+        self._last_poll = None
+        self._window = None
+        self._contradictions = 0
+
+    def record_poll(self, polled_at: float, *, changed: bool) -> None:
+        """Record a poll at the given monotonic time.
+
+        Args:
+            polled_at: monotonic time at which the poll was sent.
+            changed: if the poll saw values which changed since the last poll.
+
+        """
+        last_poll = self._last_poll
+        self._last_poll = polled_at
+        if last_poll is None:
+            return
+        if self._window is None:
+            if changed:
+                self._start_window(last_poll, polled_at)
+            return
+        earliest, latest = self._window
+        earliest = max(earliest - self._drift_s, latest - self._period_s)
+        pieces = self._narrow((earliest, latest), last_poll, polled_at, changed=changed)
+        if not pieces:
+            self._contradictions += 1
+            if self._contradictions < _CONTRADICTIONS_LIMIT:
+                # values may not change with each refresh, so the poll may
+                # just have missed a change
+                self._window = (earliest, latest)
+                return
+            # the refresh moved, learn again
+            _LOGGER.debug("Refresh time of device values lost")
+            self._window = None
+            if changed:
+                self._start_window(last_poll, polled_at)
+            return
+        self._contradictions = 0
+        was_locked = self.is_locked
+        if len(pieces) == 1:
+            self._window = pieces[0]
+        else:
+            # ambiguous, only account for the drift
+            self._window = (earliest, latest)
+        if self.is_locked and not was_locked:
+            _LOGGER.debug("Polls aligned with refresh of device values")
+
+    def _narrow(
+        self,
+        window: tuple[float, float],
+        last_poll: float,
+        polled_at: float,
+        *,
+        changed: bool,
+    ) -> list[tuple[float, float]]:
+        """Return the parts of the window which agree with a poll."""
+        period = self._period_s
+        earliest, latest = window
+        if not changed:
+            if polled_at - last_poll >= period:
+                # the device must have refreshed in between
+                return []
+            # the device did not refresh between both polls
+            pieces = [window]
+            for k in range(
+                math.floor((earliest - polled_at) / period),
+                math.ceil((latest - last_poll) / period) + 1,
+            ):
+                pieces = _subtract(
+                    pieces, last_poll + k * period, polled_at + k * period
+                )
+            return pieces
+        # the device refreshed between both polls
+        pieces = []
+        for k in range(
+            math.floor((last_poll - latest) / period),
+            math.ceil((polled_at - earliest) / period) + 1,
+        ):
+            start = max(earliest + k * period, last_poll)
+            end = min(latest + k * period, polled_at)
+            if start < end:
+                pieces.append((start, end))
+        return pieces
+
+    def _start_window(self, last_poll: float, polled_at: float) -> None:
+        # the window only tells about the refresh if polls are one period apart
+        if polled_at - last_poll <= self._period_s * 1.5:
+            self._window = (last_poll, polled_at)
+
+    def next_delay(self) -> float:
+        """Return the delay in seconds until the next poll."""
+        if self._window is None:
+            return self._period_s
+        earliest, latest = self._window
+        now = time.monotonic()
+        if not self.is_locked:
+            # probe in the middle of the window. Probes only tell something
+            # if the last poll was at most one period before them, otherwise
+            # poll after the window first.
+            target = self._next_after(now, (earliest + latest) / 2)
+            if self._last_poll is None or target - self._last_poll < self._period_s:
+                return target - now
+        return self._next_after(now, latest + self._margin_s) - now
+
+    def _next_after(self, now: float, time_: float) -> float:
+        """Shift a time by whole periods to half to one and a half from now.
+
+        This keeps polls at one per period on average.
+        """
+        periods = math.ceil((now + self._period_s / 2 - time_) / self._period_s)
+        return time_ + periods * self._period_s
+
+
+def _subtract(
+    pieces: list[tuple[float, float]], start: float, end: float
+) -> list[tuple[float, float]]:
+    """Remove the interval from start to end from the given intervals."""
+    result: list[tuple[float, float]] = []
+    for piece_start, piece_end in pieces:
+        if piece_start < start:
+            result.append((piece_start, min(piece_end, start)))
+        if piece_end > end:
+            result.append((max(piece_start, end), piece_end))
+    return result
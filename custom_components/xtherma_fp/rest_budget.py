@@ -0,0 +1,151 @@
+"""Budgets of Fernportal requests, shared by all clients of an API key."""
+
+import logging
+import time
+from datetime import timedelta
+
+from .const import FERNPORTAL_RATE_LIMIT_S, FERNPORTAL_REQUESTS_PER_DAY
+from .xtherma_client_common import XthermaRestBusyError
+
+_LOGGER = logging.getLogger(__name__)
+
+# Part of the daily requests kept for requests other than regular polls,
+# like validations of config flows, probes and refreshes requested by users.
+_RESERVE = 0.04
+
+# Requests which may be caught up after polls were skipped. They are still
+# sent at most one per FERNPORTAL_RATE_LIMIT_S, never in a burst.
+_CAPACITY = 3.0
+
+# Polls are sent faster while this many requests are left unused, as the
+# budget would otherwise expire.
+_HEADROOM = 2.0
+
+# Polls follow the budget with this margin, as Home Assistant schedules them
+# with a precision of one second.
+_MARGIN_S = 1.0
+
+# Requests are paused this long after being throttled without Retry-After.
+_DEFAULT_RETRY_AFTER_S = float(FERNPORTAL_RATE_LIMIT_S)
+
+
+class RestBudget:
+    """Token bucket limiting requests to Fernportal.
+
+    Fernportal limits requests per API key to one per minute and a number
+    per day. The budget is refilled continuously at the daily rate, and
+    spread evenly across all clients polling with the API key. Budget left
+    unused by skipped polls is spent on faster polls, but requests are
+    never sent less than FERNPORTAL_RATE_LIMIT_S apart.
+    """
+
+    def __init__(
+        self,
+        requests_per_day: int = FERNPORTAL_REQUESTS_PER_DAY,
+        capacity: float = _CAPACITY,
+    ) -> None:
+        """Class constructor."""
+        # requests per second
+        self._rate = (
+            requests_per_day * (1 - _RESERVE) / timedelta(days=1).total_seconds()
+        )
+        self._capacity = capacity
+        self._tokens = capacity
+        # monotonic time at which tokens were last refilled
+        self._refilled_at = time.monotonic()
+        # monotonic time until which Fernportal asked not to send requests
+        self._paused_until = 0.0
+        # monotonic time from which the next request may be sent
+        self._next_request_at = 0.0
+        # clients polling with the API key
+        self._pollers = 0
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._refilled_at) * self._rate
+        )
+        self._refilled_at = now
+        return now
+
+    def add_poller(self) -> None:
+        """Add a client polling regularly."""
+        self._pollers += 1
+
+    def remove_poller(self) -> None:
+        """Remove a client polling regularly."""
+        self._pollers = max(0, self._pollers - 1)
+
+    def acquire(self) -> None:
+        """Take the budget for one request.
+
+        Raises:
+            XthermaRestBusyError: no budget is left, the last request was
+                sent less than FERNPORTAL_RATE_LIMIT_S ago, or Fernportal
+                asked to pause requests.
+
+        """
+        now = self._refill()
+        if now < self._paused_until or now < self._next_request_at or self._tokens < 1:
+            _LOGGER.debug("Fernportal request budget exhausted")
+            raise XthermaRestBusyError
+        self._tokens -= 1
+        self._next_request_at = now + FERNPORTAL_RATE_LIMIT_S
+
+    def pause(self, retry_after_s: float | None) -> None:
+        """Pause requests after Fernportal throttled them.
+
+        Args:
+            retry_after_s: seconds to pause as sent by Fernportal, None if it
+                sent none.
+
+        """
+        if retry_after_s is None:
+            retry_after_s = _DEFAULT_RETRY_AFTER_S
+        _LOGGER.debug("Fernportal requests paused for %.0f seconds", retry_after_s)
+        now = self._refill()
+        self._paused_until = max(self._paused_until, now + retry_after_s)
+        # the budget of Fernportal is used up, so start anew
+        self._tokens = 0.0
+
+    def poll_interval(self) -> timedelta:
+        """Return the interval of each poller to share the budget evenly."""
+        return timedelta(
+            seconds=max(FERNPORTAL_RATE_LIMIT_S, max(1, self._pollers) / self._rate)
+        )
+
+    def next_poll(self, update_interval: timedelta) -> timedelta:
+        """Adjust the interval until the next poll of a client to the budget.
+
+        Polls wait while Fernportal asked to pause, until budget is left and
+        until FERNPORTAL_RATE_LIMIT_S passed since the last request. Polls at
+        the even share or faster are sent faster with headroom.
+        """
+        now = self._refill()
+        delay_s = update_interval.total_seconds()
+        if (
+            self._tokens >= _HEADROOM
+            and now >= self._paused_until
+            and update_interval <= self.poll_interval()
+        ):
+            delay_s = max(FERNPORTAL_RATE_LIMIT_S, delay_s / 2)
+        if self._tokens < 1:
+            delay_s = max(delay_s, (1 - self._tokens) / self._rate + _MARGIN_S)
+        if now < self._paused_until:
+            delay_s = max(delay_s, self._paused_until - now + _MARGIN_S)
+        if now < self._next_request_at:
+            delay_s = max(delay_s, self._next_request_at - now + _MARGIN_S)
+        return timedelta(seconds=delay_s)
+
+
+# Budgets shared by all clients, keyed by API key. They are kept after the
+# last client stopped, as Fernportal still counts requests sent before.
+_budgets: dict[str, RestBudget] = {}
+
+
+def get_budget(api_key: str) -> RestBudget:
+    """Return the budget of an API key, creating it if needed."""
+    budget = _budgets.get(api_key)
+    if budget is None:
+        budget = _budgets[api_key] = RestBudget()
+    return budget
@@ -1,37 +1,55 @@
 """Common definitions for Xtherma client variants."""
 
+import asyncio
+import time
 from abc import abstractmethod
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.helpers.entity import EntityDescription
 
 Factor = Callable[[int], float | int]
-_FACTORS: dict[str, Callable] = {
-    "*1000": lambda value: value * 1000,
-    "*100": lambda value: value * 100,
-    "*10": lambda value: value * 10,
-    "1000": lambda value: value * 1000,
-    "100": lambda value: value * 100,
-    "10": lambda value: value * 10,
-    "/1000": lambda value: value / 1000,
-    "/100": lambda value: value / 100,
-    "/10": lambda value: value / 10,
+
+# input factors as (multiplier, divisor), applied as value * multiplier / divisor
+FACTOR_SCALES: dict[str, tuple[int, int]] = {
+    "*1000": (1000, 1),
+    "*100": (100, 1),
+    "*10": (10, 1),
+    "1000": (1000, 1),
+    "100": (100, 1),
+    "10": (10, 1),
+    "/1000": (1, 1000),
+    "/100": (1, 100),
+    "/10": (1, 10),
 }
 
+
+def _scaling(multiplier: int, divisor: int) -> Callable:
+    """Return a function scaling values, keeping integers without divisor."""
+    if divisor == 1:
+        return lambda value: value * multiplier
+    return lambda value: value * multiplier / divisor
+
+
+# functions applying input factors, and reverting them for writes
+_FACTORS: dict[str, Callable] = {
+    factor: _scaling(multiplier, divisor)
+    for factor, (multiplier, divisor) in FACTOR_SCALES.items()
+}
 _RFACTORS: dict[str, Callable] = {
-    "*1000": lambda value: value / 1000,
-    "*100": lambda value: value / 100,
-    "*10": lambda value: value / 10,
-    "1000": lambda value: value / 1000,
-    "100": lambda value: value / 100,
-    "10": lambda value: value / 10,
-    "/1000": lambda value: value * 1000,
-    "/100": lambda value: value * 100,
-    "/10": lambda value: value * 10,
+    factor: _scaling(divisor, multiplier)
+    for factor, (multiplier, divisor) in FACTOR_SCALES.items()
 }
 
 
+def input_factor_function(inputfactor: str | None) -> Factor | None:
+    """Return the function applying an input factor, None if it has no effect."""
+    if not inputfactor:
+        return None
+    return _FACTORS.get(inputfactor)
+
+
 class XthermaModbusBusyError(Exception):
     """Exception indicating busy on Modbus read or write."""
 
@@ -64,6 +82,14 @@ class XthermaNotConnectedError(Exception):
         super().__init__("Not connected error")
 
 
+class XthermaDeviceOfflineError(Exception):
+    """Exception indicating the device did not respond for a while."""
+
+    def __init__(self) -> None:
+        """Class constructor."""
+        super().__init__("Device offline")
+
+
 class XthermaRestApiError(Exception):
     """Exception indicating a REST API error."""
 
@@ -108,11 +134,25 @@ class XthermaTimeoutError(Exception):
 class XthermaClient:
     """Base class for Xtherma clients."""
 
+    # results younger than this many seconds are returned again instead of
+    # reading the device
+    result_cache_s: float = 0.0
+
+    _read_task: asyncio.Task[dict[str, int | float]] | None = None
+    # monotonic time and result of the last successful read
+    _cached_result: tuple[float, dict[str, int | float]] | None = None
+    # callers waiting for the running read
+    _read_waiters = 0
+
     @abstractmethod
     def update_interval(self) -> timedelta:
         """Return update interval for data coordinator."""
         raise NotImplementedError
 
+    def next_update_interval(self, update_interval: timedelta) -> timedelta:
+        """Adjust the interval until the next poll, e.g. to a rate limit."""
+        return update_interval
+
     @abstractmethod
     async def connect(self) -> None:
         """Connect client to server endpoint."""
@@ -123,9 +163,49 @@ class XthermaClient:
         """Disconnect client."""
         raise NotImplementedError
 
-    @abstractmethod
     async def async_get_data(self) -> dict[str, int | float]:
-        """Obtain fresh data."""
+        """Obtain fresh data.
+
+        Clients may return only the values which were due for an update.
+        Concurrent callers share a single read of the device.
+        """
+        cached = self._cached_result
+        if cached is not None and time.monotonic() - cached[0] < self.result_cache_s:
+            return dict(cached[1])
+        if self._read_task is None:
+            self._read_task = asyncio.create_task(
+                self._async_read_data(), name="xtherma_fp read"
+            )
+            self._read_task.add_done_callback(self._read_done)
+        read_task = self._read_task
+        # one caller being cancelled must not cancel the read of the others
+        self._read_waiters += 1
+        try:
+            return dict(await asyncio.shield(read_task))
+        finally:
+            self._read_waiters -= 1
+            if not self._read_waiters and not read_task.done():
+                # all callers gave up, stop reading
+                read_task.cancel()
+
+    def _read_done(self, task: asyncio.Task[dict[str, int | float]]) -> None:
+        self._read_task = None
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._cached_result = (time.monotonic(), task.result())
+
+    def _clear_result_cache(self) -> None:
+        """Read the device again with the next call of async_get_data()."""
+        self._cached_result = None
+
+    @abstractmethod
+    async def _async_read_data(self) -> dict[str, int | float]:
+        """Read data from the device."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def async_probe(self) -> None:
+        """Check that the device responds, using as little traffic as possible."""
         raise NotImplementedError
 
     @abstractmethod
@@ -133,16 +213,51 @@ class XthermaClient:
         """Write data."""
         raise NotImplementedError
 
+    async def async_get_values(self, keys: list[str]) -> dict[str, int | float]:
+        """Read current values of the given keys.
+
+        Clients which cannot read single values return an empty dict.
+        """
+        return {}
+
+    async def async_put_data_many(
+        self, writes: list[tuple[EntityDescription, int | float]]
+    ) -> list[Exception | None]:
+        """Write several values.
+
+        Returns the error of each write, or None if it succeeded. Clients may
+        combine writes into fewer requests.
+        """
+        results: list[Exception | None] = []
+        for desc, value in writes:
+            try:
+                await self.async_put_data(value=value, desc=desc)
+            except Exception as err:  # noqa: BLE001
+                results.append(err)
+            else:
+                results.append(None)
+        return results
+
     @abstractmethod
     def get_entity_descriptions(self) -> list[EntityDescription]:
         """Get all entity descriptions."""
         raise NotImplementedError
 
-    def _apply_input_factor(self, value: int, inputfactor: str | None) -> int | float:
-        if not inputfactor:
-            return value
-        function = _FACTORS.get(inputfactor, lambda v: v)
-        return function(value)
+    def set_disabled_keys(self, keys: set[str]) -> None:
+        """Skip data of disabled entities, if the client supports it."""
+
+    def get_update_period(self, key: str) -> timedelta:
+        """Return how often the value of a key is read from the device."""
+        return self.update_interval()
+
+    @property
+    def is_failed_over(self) -> bool:
+        """Return if values are read from a fallback instead of the device."""
+        return False
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the state of the client for diagnostics."""
+        return {}
 
     def _reverse_apply_input_factor(self, value: float, inputfactor: str | None) -> int:
         if not isinstance(inputfactor, str):
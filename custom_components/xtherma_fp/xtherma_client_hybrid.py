@@ -0,0 +1,220 @@
+"""Client reading Modbus, falling back to Fernportal."""
+
+import logging
+import time
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import Any
+
+from homeassistant.helpers.entity import EntityDescription
+
+from .xtherma_client_common import (
+    XthermaClient,
+    XthermaError,
+    XthermaModbusEmptyDataError,
+    XthermaModbusError,
+    XthermaNotConnectedError,
+    XthermaTimeoutError,
+)
+from .xtherma_client_modbus import XthermaClientModbus
+from .xtherma_client_rest import XthermaClientRest
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors of the Modbus client after which Fernportal is read instead. Busy
+# devices do respond, so they are not failed over.
+_FAILOVER_ERRORS = (
+    XthermaNotConnectedError,
+    XthermaTimeoutError,
+    XthermaModbusError,
+    XthermaModbusEmptyDataError,
+    XthermaError,
+)
+
+
+class DataSource(StrEnum):
+    """Source of a value."""
+
+    MODBUS = "modbus"
+    REST = "rest"
+
+
+class XthermaClientHybrid(XthermaClient):
+    """Client reading Modbus, falling back to Fernportal.
+
+    Modbus is read as long as the local connection works. While it does
+    not, values are read from Fernportal within its budget of requests.
+    Values only Fernportal provides are read from it at the rate of its
+    budget. Writes always use Modbus.
+    """
+
+    def __init__(
+        self, primary: XthermaClientModbus, fallback: XthermaClientRest
+    ) -> None:
+        """Class constructor."""
+        self._primary = primary
+        self._fallback = fallback
+        primary_keys = {desc.key for desc in primary.get_entity_descriptions()}
+        # descriptions of values only Fernportal provides
+        self._backfill_descriptions = [
+            desc
+            for desc in fallback.get_entity_descriptions()
+            if desc.key not in primary_keys
+        ]
+        self._backfill_keys = frozenset(
+            desc.key for desc in self._backfill_descriptions
+        )
+        # monotonic time of the last read of Fernportal
+        self._fallback_read_at: float | None = None
+        # set while Modbus cannot be read
+        self._failover = False
+        # source and time of the last read of each key
+        self._sources: dict[str, tuple[DataSource, datetime]] = {}
+
+    @property
+    def is_failed_over(self) -> bool:
+        """Return if values are read from Fernportal instead of Modbus."""
+        return self._failover
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the source of each value and the state of both clients."""
+        return {
+            "failed_over": self._failover,
+            "sources": {
+                key: {"source": source, "read_at": read_at.isoformat()}
+                for key, (source, read_at) in sorted(self._sources.items())
+            },
+            "modbus": self._primary.get_diagnostics(),
+        }
+
+    def update_interval(self) -> timedelta:
+        """Return update interval for data coordinator."""
+        return self._primary.update_interval()
+
+    def next_update_interval(self, update_interval: timedelta) -> timedelta:
+        """Poll within the budget of Fernportal while it is read instead."""
+        if not self._failover:
+            return update_interval
+        return self._fallback.next_update_interval(
+            max(update_interval, self._fallback.update_interval())
+        )
+
+    def get_update_period(self, key: str) -> timedelta:
+        """Return how often the value of a key is read."""
+        if key in self._backfill_keys:
+            return self._fallback.update_interval()
+        period = self._primary.get_update_period(key)
+        if self._failover:
+            return max(period, self._fallback.update_interval())
+        return period
+
+    def set_disabled_keys(self, keys: set[str]) -> None:
+        """Do not read registers of disabled entities."""
+        self._primary.set_disabled_keys(keys)
+
+    async def connect(self) -> None:
+        """Connect to Modbus, failing over to Fernportal if that fails."""
+        if self._backfill_keys:
+            await self._fallback.connect()
+        try:
+            await self._primary.connect()
+        except XthermaNotConnectedError:
+            _LOGGER.debug("Modbus not connected, reconnecting in background")
+            await self._start_failover()
+
+    async def disconnect(self) -> None:
+        """Disconnect both clients."""
+        await self._primary.disconnect()
+        await self._fallback.disconnect()
+
+    async def _start_failover(self) -> None:
+        if self._failover:
+            return
+        _LOGGER.warning("Modbus unreachable, reading values from Fernportal")
+        self._failover = True
+        # poll with the budget of the API key while failed over
+        await self._fallback.connect()
+
+    async def _stop_failover(self) -> None:
+        if not self._failover:
+            return
+        _LOGGER.info("Modbus reachable again")
+        self._failover = False
+        if not self._backfill_keys:
+            await self._fallback.disconnect()
+
+    def _track(self, values: dict[str, int | float], source: DataSource) -> None:
+        now = datetime.now(UTC)
+        for key in values:
+            self._sources[key] = (source, now)
+
+    async def _async_read_fallback(self) -> dict[str, int | float]:
+        values = await self._fallback.async_get_data()
+        self._fallback_read_at = time.monotonic()
+        return values
+
+    def _backfill_due(self) -> bool:
+        if not self._backfill_keys:
+            return False
+        if self._fallback_read_at is None:
+            return True
+        interval = self._fallback.update_interval().total_seconds()
+        return time.monotonic() - self._fallback_read_at >= interval
+
+    async def _async_read_data(self) -> dict[str, int | float]:
+        """Read Modbus, or Fernportal while Modbus cannot be read."""
+        try:
+            values = await self._primary.async_get_data()
+        except _FAILOVER_ERRORS as err:
+            await self._start_failover()
+            try:
+                values = await self._async_read_fallback()
+            except Exception as fallback_err:
+                _LOGGER.debug("Fernportal fallback failed: %s", fallback_err)
+                raise err from fallback_err
+            self._track(values, DataSource.REST)
+            return values
+        await self._stop_failover()
+        self._track(values, DataSource.MODBUS)
+        if self._backfill_due():
+            try:
+                backfill = await self._async_read_fallback()
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Fernportal backfill failed: %s", err)
+            else:
+                backfill = {
+                    key: value
+                    for key, value in backfill.items()
+                    if key in self._backfill_keys
+                }
+                self._track(backfill, DataSource.REST)
+                values |= backfill
+        return values
+
+    async def async_probe(self) -> None:
+        """Probe Modbus, or Fernportal while Modbus cannot be read."""
+        try:
+            await self._primary.async_probe()
+        except _FAILOVER_ERRORS:
+            await self._start_failover()
+            await self._fallback.async_probe()
+        else:
+            await self._stop_failover()
+
+    async def async_put_data(self, value: int | float, desc: EntityDescription) -> None:
+        """Write data using Modbus."""
+        await self._primary.async_put_data(value, desc)
+
+    async def async_put_data_many(
+        self, writes: list[tuple[EntityDescription, int | float]]
+    ) -> list[Exception | None]:
+        """Write several values using Modbus."""
+        return await self._primary.async_put_data_many(writes)
+
+    async def async_get_values(self, keys: list[str]) -> dict[str, int | float]:
+        """Read current values of the given keys using Modbus."""
+        return await self._primary.async_get_values(keys)
+
+    def get_entity_descriptions(self) -> list[EntityDescription]:
+        """Get all entity descriptions."""
+        return self._primary.get_entity_descriptions() + self._backfill_descriptions
@@ -1,24 +1,41 @@
 """Client to access Modbus server on Xtherma FP module."""
 
+import asyncio
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import asdict, dataclass
 from datetime import timedelta
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
 )
 from homeassistant.helpers.entity import EntityDescription
 
-from .const import (
-    MODBUS_TIMEOUT_S,
-)
 from .entity_descriptors import (
     MODBUS_ENTITY_DESCRIPTIONS,
-    MODBUS_REGISTER_RANGES,
     MODBUS_REGISTER_SIZE,
+    ModbusRegisterRange,
     ModbusRegisterSet,
     XtNumericEntityDescription,
     XtSensorEntityDescription,
 )
+from .modbus_connection import (
+    ModbusConnection,
+    ModbusConnectionState,
+    RequestPriority,
+    acquire_connection,
+    release_connection,
+)
+from .modbus_plan import (
+    MODBUS_REGISTER_BYTES,
+    ModbusDecodePlan,
+    compile_decode_plan,
+    plan_read_ranges,
+)
 from .vendor.pymodbus import AsyncModbusTcpClient, ExcCodes, ModbusException
 from .xtherma_client_common import (
     XthermaClient,
@@ -32,14 +49,98 @@ from .xtherma_client_common import (
 _LOGGER = logging.getLogger(__name__)
 
 _MODBUS_MAX_VALUE: int = 65535
-_MODBUS_UPDATE_PERIOD_S: int = 30
+
+# The coordinator polls at the rate of the most frequently updated register set.
+_MODBUS_UPDATE_PERIOD_S: int = min(
+    reg_desc.update_period_s for reg_desc in MODBUS_ENTITY_DESCRIPTIONS
+)
+
+# Register sets which become due within this time are read in the current poll,
+# so small timer jitter does not postpone them by a whole update period.
+_MODBUS_SCHEDULE_TOLERANCE_S: float = 1.0
+
+# Register read to check if the device responds.
+_MODBUS_PROBE_REGISTER: int = MODBUS_ENTITY_DESCRIPTIONS[0].base
+
+# The modbus protocol only allows writing up to 123 registers at once.
+_MODBUS_MAX_WRITE_COUNT: int = 123
+
+
+@dataclass(frozen=True)
+class ModbusRetryPolicy:
+    """Retries of requests the device rejected because it was busy."""
+
+    # retries after the first attempt
+    max_retries: int = 3
+    # delay in seconds before the first retry, doubled for each further retry
+    initial_delay_s: float = 0.2
+    max_delay_s: float = 2.0
+    # delays are randomized by this fraction, so requests of several
+    # devices behind one gateway do not retry in lockstep
+    jitter: float = 0.2
+    # time in seconds one poll or one write may take including all retries
+    budget_s: float = 10.0
+
+    def delay(self, retry: int) -> float:
+        """Return the delay in seconds before the given retry."""
+        delay = min(self.max_delay_s, self.initial_delay_s * 2**retry)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)  # noqa: S311
+
+
+DEFAULT_MODBUS_RETRY_POLICY = ModbusRetryPolicy()
+
+
+@dataclass
+class ModbusRetryStats:
+    """Counters of busy retries."""
+
+    # retries sent
+    retries: int = 0
+    # requests which succeeded after being retried
+    recovered: int = 0
+    # requests which were still busy when retries or time ran out
+    exhausted: int = 0
+
+
+def _overlaps(reg_desc: ModbusRegisterSet, r: ModbusRegisterRange) -> bool:
+    """Test if a register set shares registers with a read range."""
+    return reg_desc.base <= r.last_reg and reg_desc.last_reg >= r.first_reg
+
+
+def _get_poll_priority(
+    r: ModbusRegisterRange, reg_descs: list[ModbusRegisterSet]
+) -> RequestPriority:
+    """Return the priority of polling a range for the given register sets."""
+    if any(
+        reg_desc.update_period_s <= _MODBUS_UPDATE_PERIOD_S and _overlaps(reg_desc, r)
+        for reg_desc in reg_descs
+    ):
+        return RequestPriority.TELEMETRY
+    return RequestPriority.SETTINGS
+
+
+def _contiguous_runs(addresses: list[int]) -> list[tuple[int, int]]:
+    """Split sorted addresses into runs of consecutive registers.
+
+    Returns tuples of first register and register count.
+    """
+    runs: list[tuple[int, int]] = []
+    for address in addresses:
+        if runs:
+            first_reg, count = runs[-1]
+            if address == first_reg + count and count < _MODBUS_MAX_WRITE_COUNT:
+                runs[-1] = (first_reg, count + 1)
+                continue
+        runs.append((address, 1))
+    return runs
 
 
 class XthermaClientModbus(XthermaClient):
     """Modbus access client."""
 
-    _client: AsyncModbusTcpClient | None = None
+    _connection: ModbusConnection | None = None
     detect_empty_modbus_data: bool
+    retry_policy: ModbusRetryPolicy
 
     def __init__(
         self,
@@ -53,50 +154,85 @@ class XthermaClientModbus(XthermaClient):
         self._address = address
         self._desc_regset_cache: dict[str, int] = {}
         self._last_update: dict[str, int | float] = {}
-        self._read_buffer = [0] * MODBUS_REGISTER_SIZE
+        # monotonic time at which each register set (by base) needs to be read again
+        self._next_update: dict[int, float] = {}
+        self._disabled_keys: frozenset[str] = frozenset()
+        self._update_periods: dict[str, int] = {
+            desc.key: reg_desc.update_period_s
+            for reg_desc in MODBUS_ENTITY_DESCRIPTIONS
+            for desc in reg_desc.descriptors
+            if desc is not None
+        }
+        self._read_ranges = plan_read_ranges(MODBUS_ENTITY_DESCRIPTIONS)
+        self._decode_plans = self._compile_decode_plans()
+        # big endian image of all registers, as transferred by the device
+        self._read_buffer = bytearray(MODBUS_REGISTER_SIZE * MODBUS_REGISTER_BYTES)
         self.detect_empty_modbus_data = True
+        self.retry_policy = DEFAULT_MODBUS_RETRY_POLICY
+        self._retry_stats = ModbusRetryStats()
 
     async def connect(self) -> None:
         """Connect client to server endpoint."""
-        self._client = AsyncModbusTcpClient(
-            host=self._host,
-            port=self._port,
-            timeout=float(MODBUS_TIMEOUT_S),
-        )
-        try:
-            _LOGGER.debug("connecting client")
-            result = await self._client.connect()
-            _LOGGER.debug(
-                "connected client success = %s, connected = %s",
-                result,
-                self._client.connected,
-            )
-        except Exception as err:
-            _LOGGER.exception("connection error")
-            raise XthermaNotConnectedError from err
-        if not result:
-            raise XthermaNotConnectedError
+        if self._connection is None:
+            self._connection = acquire_connection(self._host, self._port)
+        await self._connection.async_connect()
 
     async def disconnect(self) -> None:
         """Disconnect client."""
-        if self._client:
+        if self._connection:
             _LOGGER.debug("disconnect")
-            self._client.close()
-            self._client = None
+            release_connection(self._host, self._port)
+            self._connection = None
+
+    @property
+    def connection_state(self) -> ModbusConnectionState:
+        """Return health of the Modbus connection."""
+        if self._connection is None:
+            return ModbusConnectionState.DOWN
+        return self._connection.get_state(int(self._address))
+
+    @property
+    def retry_stats(self) -> ModbusRetryStats:
+        """Return how often requests were retried because the device was busy."""
+        return self._retry_stats
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return the connection and busy retries for diagnostics."""
+        return {
+            "connection_state": self.connection_state,
+            "retry_stats": asdict(self._retry_stats),
+        }
 
     def update_interval(self) -> timedelta:
         """Return update interval for data coordinator."""
         return timedelta(seconds=_MODBUS_UPDATE_PERIOD_S)
 
-    # decode two's complement for negative scalar values.
-    def _decode_int(self, raw_value: int, desc: EntityDescription) -> int:
-        if not isinstance(desc, XtNumericEntityDescription):
-            return raw_value
-        if desc.device_class == SensorDeviceClass.ENUM:
-            return raw_value
-        if raw_value > _MODBUS_MAX_VALUE // 2:
-            return -((raw_value - 1) ^ _MODBUS_MAX_VALUE)
-        return raw_value
+    def get_update_period(self, key: str) -> timedelta:
+        """Return how often the value of a key is read from the device."""
+        return timedelta(seconds=self._update_periods.get(key, _MODBUS_UPDATE_PERIOD_S))
+
+    def set_disabled_keys(self, keys: set[str]) -> None:
+        """Do not read registers of disabled entities."""
+        disabled_keys = frozenset(keys)
+        if disabled_keys == self._disabled_keys:
+            return
+        self._disabled_keys = disabled_keys
+        self._read_ranges = plan_read_ranges(
+            MODBUS_ENTITY_DESCRIPTIONS, disabled_keys=disabled_keys
+        )
+        self._decode_plans = self._compile_decode_plans()
+        _LOGGER.debug(
+            "planned %d read ranges, %d keys disabled",
+            len(self._read_ranges),
+            len(disabled_keys),
+        )
+
+    def _compile_decode_plans(self) -> dict[int, ModbusDecodePlan]:
+        """Compile decode plans of all register sets, keyed by base."""
+        return {
+            reg_desc.base: compile_decode_plan(reg_desc, self._disabled_keys)
+            for reg_desc in MODBUS_ENTITY_DESCRIPTIONS
+        }
 
     # apply two's complement for negative scalar values.
     def _encode_int(self, signed_value: int, desc: EntityDescription) -> int:
@@ -109,32 +245,103 @@ class XthermaClientModbus(XthermaClient):
         return signed_value
 
     async def _get_client(self) -> AsyncModbusTcpClient:
-        if self._client is None or not self._client.connected:
-            _LOGGER.debug("not connected, try connecting")
+        if self._connection is None:
             await self.connect()
-            # the following check is only for safety and ruff, self.connect() will have
-            # alredy raised an exception if the reconnect fails
-            if self._client is None or not self._client.connected:
-                raise XthermaNotConnectedError
-        return self._client
+        # the following check is only for safety and ruff, self.connect() will
+        # have already raised an exception if connecting fails
+        if self._connection is None:
+            raise XthermaNotConnectedError
+        return self._connection.get_client()
+
+    def _record_success(self) -> None:
+        if self._connection is not None:
+            self._connection.record_success(int(self._address))
+
+    def _record_failure(self) -> None:
+        if self._connection is not None:
+            self._connection.record_failure(int(self._address))
+
+    def _request_slot(
+        self, priority: RequestPriority
+    ) -> AbstractAsyncContextManager[None]:
+        """Wait for our turn on the shared connection."""
+        if self._connection is None:
+            return nullcontext()
+        return self._connection.request_slot(int(self._address), priority)
+
+    def _get_deadline(self) -> float:
+        """Return the monotonic time until which busy requests are retried."""
+        return time.monotonic() + self.retry_policy.budget_s
+
+    async def _retry_busy(
+        self, request: Callable[[], Awaitable[None]], deadline: float
+    ) -> None:
+        """Send a request, retrying it while the device is busy.
+
+        Retries stop when the retry policy is exhausted, or when waiting for
+        the next retry would pass the deadline.
+        """
+        policy = self.retry_policy
+        retry = 0
+        while True:
+            try:
+                await request()
+            except XthermaModbusBusyError:
+                delay = policy.delay(retry)
+                if retry >= policy.max_retries or time.monotonic() + delay > deadline:
+                    self._retry_stats.exhausted += 1
+                    raise
+                _LOGGER.debug("Modbus device busy, retry %d in %.2fs", retry + 1, delay)
+                self._retry_stats.retries += 1
+                retry += 1
+                await asyncio.sleep(delay)
+            else:
+                if retry:
+                    self._retry_stats.recovered += 1
+                return
 
     async def _read_modbus_range(
-        self, client: AsyncModbusTcpClient, address: int, length: int
+        self,
+        client: AsyncModbusTcpClient,
+        address: int,
+        length: int,
+        deadline: float,
+        priority: RequestPriority,
     ) -> None:
-        """Read a range of modbus holding registers into read buffer."""
+        """Read a range of modbus holding registers into read buffer.
+
+        The read is retried until the deadline while the device is busy.
+        """
+        await self._retry_busy(
+            lambda: self._read_modbus_range_once(client, address, length, priority),
+            deadline,
+        )
+
+    async def _read_modbus_range_once(
+        self,
+        client: AsyncModbusTcpClient,
+        address: int,
+        length: int,
+        priority: RequestPriority,
+    ) -> None:
+        """Send a single read request for a range of holding registers."""
         try:
-            regs = await client.read_holding_registers(
-                address=address,
-                count=length,
-                device_id=int(self._address),
-            )
+            async with self._request_slot(priority):
+                regs = await client.read_holding_registers(
+                    address=address,
+                    count=length,
+                    device_id=int(self._address),
+                )
         except ModbusException as err:
             _LOGGER.debug("Modbus exception: %s", err.string)
+            self._record_failure()
             raise XthermaModbusError from err
         except Exception as err:
             _LOGGER.exception("Exception error")
+            self._record_failure()
             raise XthermaError from err
         else:
+            self._record_success()
             if regs.isError():
                 exc_code = regs.exception_code
                 if exc_code == ExcCodes.DEVICE_BUSY:
@@ -142,88 +349,292 @@ class XthermaClientModbus(XthermaClient):
                     raise XthermaModbusBusyError
                 _LOGGER.debug("Modbus error %s", regs.exception_code)
                 raise XthermaModbusError
-            self._read_buffer[address : address + length] = regs.registers
+            payload = regs.register_bytes
+            if len(payload) != length * MODBUS_REGISTER_BYTES:
+                _LOGGER.debug(
+                    "Modbus read of %d registers returned %d bytes",
+                    length,
+                    len(payload),
+                )
+                raise XthermaModbusError
+            offset = address * MODBUS_REGISTER_BYTES
+            self._read_buffer[offset : offset + len(payload)] = payload
+
+    async def _read_modbus_ranges(
+        self,
+        client: AsyncModbusTcpClient,
+        reg_descs: list[ModbusRegisterSet],
+    ) -> list[ModbusRegisterRange]:
+        """Read planned register ranges into read buffer.
 
-    async def _read_modbus_ranges(self, client: AsyncModbusTcpClient) -> None:
-        """Read ranges defined in MODBUS_REGISTER_RANGES into read buffer."""
-        for r in MODBUS_REGISTER_RANGES:
-            await self._read_modbus_range(client, address=r.first_reg, length=r.length)
+        Only ranges covering at least one of the given register sets are read.
+        All reads are issued concurrently, the client pipelines them. Ranges
+        holding telemetry are sent before ranges holding settings only.
+
+        Returns the ranges which failed, so the data of all other ranges can
+        still be used. Raises the error of the first failed range if no range
+        could be read at all.
+        """
+        ranges = [
+            r
+            for r in self._read_ranges
+            if any(_overlaps(reg_desc, r) for reg_desc in reg_descs)
+        ]
+        # all retries of one poll share a time budget
+        deadline = self._get_deadline()
+        results = await asyncio.gather(
+            *(
+                self._read_modbus_range(
+                    client,
+                    address=r.first_reg,
+                    length=r.length,
+                    deadline=deadline,
+                    priority=_get_poll_priority(r, reg_descs),
+                )
+                for r in ranges
+            ),
+            return_exceptions=True,
+        )
+        failed: list[tuple[ModbusRegisterRange, BaseException]] = []
+        for r, result in zip(ranges, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                failed.append((r, result))
             # we know that no single register range can ever be empty, so lets
-            # throw an exception if we just read empty data.
+            # treat the range as failed if we just read empty data.
             # see also test_modbus_register_ranges_cannot_be_empty()
-            if (
+            elif (
                 self.detect_empty_modbus_data
-                and self._read_buffer[r.non_empty_reg] == 0
+                and r.non_empty_reg is not None
+                and self._is_register_empty(r.non_empty_reg)
             ):
-                raise XthermaModbusEmptyDataError
+                failed.append((r, XthermaModbusEmptyDataError()))
+        for r, err in failed:
+            _LOGGER.debug(
+                "reading registers %d-%d failed: %r", r.first_reg, r.last_reg, err
+            )
+        if failed and len(failed) == len(ranges):
+            # report the error of the first failed range
+            raise failed[0][1]
+        return [r for r, _ in failed]
 
-    async def _read_bank(
+    def _is_register_empty(self, address: int) -> bool:
+        offset = address * MODBUS_REGISTER_BYTES
+        return not any(self._read_buffer[offset : offset + MODBUS_REGISTER_BYTES])
+
+    def _read_bank(
         self,
         reg_desc: ModbusRegisterSet,
     ) -> None:
-        """Read a bank of modbus holding registers."""
-        for i, desc in enumerate(reg_desc.descriptors):
-            if not desc:
-                _LOGGER.debug("no descriptor for %d.%d", reg_desc.base, i)
-            else:
-                raw_value = self._read_buffer[reg_desc.base + i]
-                decoded_value = self._decode_int(raw_value, desc)
-                if isinstance(desc, XtSensorEntityDescription) and desc.factor:
-                    input_factor = desc.factor
-                    value = self._apply_input_factor(decoded_value, input_factor)
-                else:
-                    input_factor = ""
-                    value = decoded_value
-                self._last_update[desc.key] = value
-                _LOGGER.debug(
-                    'key="%s" raw="%s" value="%s" inputfactor="%s"',
-                    desc.key,
-                    raw_value,
-                    value,
-                    input_factor,
-                )
+        """Decode a bank of modbus holding registers from the read buffer."""
+        plan = self._decode_plans[reg_desc.base]
+        plan.decode(self._read_buffer, self._last_update)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "bank %d: %s",
+                reg_desc.base,
+                {key: self._last_update[key] for key in plan.keys},
+            )
+
+    def _get_due_register_sets(self, now: float) -> list[ModbusRegisterSet]:
+        """Return all register sets whose update period has elapsed.
+
+        Sets updated at the polling rate are read on every poll, including
+        refreshes requested in between regular updates.
+        """
+        deadline = now + _MODBUS_SCHEDULE_TOLERANCE_S
+        return [
+            reg_desc
+            for reg_desc in MODBUS_ENTITY_DESCRIPTIONS
+            if reg_desc.update_period_s <= _MODBUS_UPDATE_PERIOD_S
+            or self._next_update.get(reg_desc.base, 0.0) <= deadline
+        ]
+
+    def _invalidate_register_set(self, address: int) -> None:
+        """Make the register set containing address due for the next poll."""
+        self._clear_result_cache()
+        for reg_desc in MODBUS_ENTITY_DESCRIPTIONS:
+            if reg_desc.base <= address <= reg_desc.last_reg:
+                self._next_update.pop(reg_desc.base, None)
+                return
 
-    async def async_get_data(self) -> dict[str, int | float]:
-        """Obtain fresh data."""
+    async def _async_read_data(self) -> dict[str, int | float]:
+        """Read due register sets.
+
+        Only register sets whose update period has elapsed are read, so the
+        result may contain a subset of all keys. Register sets touching a
+        range which failed to read are left out and stay due, so they are
+        retried with the next poll.
+        """
         self._last_update = {}
+        now = time.monotonic()
+        due = self._get_due_register_sets(now)
         client = await self._get_client()
-        await self._read_modbus_ranges(client)
-        for reg_desc in MODBUS_ENTITY_DESCRIPTIONS:
-            await self._read_bank(reg_desc)
+        failed = await self._read_modbus_ranges(client, due)
+        read = [
+            reg_desc
+            for reg_desc in due
+            if not any(_overlaps(reg_desc, r) for r in failed)
+        ]
+        for reg_desc in read:
+            self._read_bank(reg_desc)
+            self._next_update[reg_desc.base] = now + reg_desc.update_period_s
+        _LOGGER.debug(
+            "read %d of %d register sets, %d failed, %s",
+            len(read),
+            len(MODBUS_ENTITY_DESCRIPTIONS),
+            len(due) - len(read),
+            self._retry_stats,
+        )
         return self._last_update
 
-    async def async_put_data(self, value: int | float, desc: EntityDescription) -> None:
-        """Write data."""
+    async def async_probe(self) -> None:
+        """Read a single register to check that the device responds."""
         client = await self._get_client()
         try:
-            address = self._get_register_address(desc.key)
-            if isinstance(desc, XtSensorEntityDescription):
-                int_value = self._reverse_apply_input_factor(value, desc.factor)
-            else:
-                int_value = int(value)
-            encoded_value = self._encode_int(int_value, desc)
-            _LOGGER.debug(
-                'Writing "%s" = %d @ address %d',
-                desc.key,
-                encoded_value,
-                address,
+            await self._read_modbus_range_once(
+                client,
+                address=_MODBUS_PROBE_REGISTER,
+                length=1,
+                priority=RequestPriority.TELEMETRY,
             )
-            regs = await client.write_register(
-                address=address,
-                value=encoded_value,
-                device_id=int(self._address),
+        except XthermaModbusBusyError:
+            _LOGGER.debug("Modbus device busy, but responding")
+
+    async def async_get_values(self, keys: list[str]) -> dict[str, int | float]:
+        """Read current values of the given keys, only reading their registers."""
+        addresses = sorted({self._get_register_address(key) for key in keys})
+        client = await self._get_client()
+        deadline = self._get_deadline()
+        await asyncio.gather(
+            *(
+                self._read_modbus_range(
+                    client,
+                    address=first_reg,
+                    length=count,
+                    deadline=deadline,
+                    priority=RequestPriority.CONFIRM,
+                )
+                for first_reg, count in _contiguous_runs(addresses)
             )
+        )
+        result: dict[str, int | float] = {}
+        for reg_desc in MODBUS_ENTITY_DESCRIPTIONS:
+            if any(reg_desc.base <= a <= reg_desc.last_reg for a in addresses):
+                self._decode_plans[reg_desc.base].decode(self._read_buffer, result)
+        return {key: result[key] for key in keys if key in result}
+
+    async def async_put_data(self, value: int | float, desc: EntityDescription) -> None:
+        """Write data."""
+        client = await self._get_client()
+        try:
+            address, encoded_value = self._encode_write(value, desc)
         except Exception as err:
             _LOGGER.exception("Exception error")
             raise XthermaModbusError from err
+        await self._write_modbus_registers(
+            client, address, [encoded_value], self._get_deadline()
+        )
+
+    async def async_put_data_many(
+        self, writes: list[tuple[EntityDescription, int | float]]
+    ) -> list[Exception | None]:
+        """Write several values, combining adjacent registers into one request."""
+        results: list[Exception | None] = [None] * len(writes)
+        try:
+            client = await self._get_client()
+        except XthermaNotConnectedError as err:
+            return [err] * len(writes)
+        # encoded value and indices of all writes per address, last value wins
+        by_address: dict[int, tuple[int, list[int]]] = {}
+        for i, (desc, value) in enumerate(writes):
+            try:
+                address, encoded_value = self._encode_write(value, desc)
+            except Exception:
+                _LOGGER.exception("Exception error")
+                results[i] = XthermaModbusError()
+                continue
+            indices = by_address.get(address, (0, []))[1]
+            by_address[address] = (encoded_value, [*indices, i])
+        deadline = self._get_deadline()
+        for first_reg, count in _contiguous_runs(sorted(by_address)):
+            addresses = range(first_reg, first_reg + count)
+            try:
+                await self._write_modbus_registers(
+                    client, first_reg, [by_address[a][0] for a in addresses], deadline
+                )
+            except (XthermaModbusBusyError, XthermaModbusError) as err:
+                for a in addresses:
+                    for i in by_address[a][1]:
+                        results[i] = err
+        return results
+
+    def _encode_write(
+        self, value: int | float, desc: EntityDescription
+    ) -> tuple[int, int]:
+        """Return register address and raw register value of a write."""
+        address = self._get_register_address(desc.key)
+        if isinstance(desc, XtSensorEntityDescription):
+            int_value = self._reverse_apply_input_factor(value, desc.factor)
         else:
+            int_value = int(value)
+        encoded_value = self._encode_int(int_value, desc)
+        _LOGGER.debug(
+            'Writing "%s" = %d @ address %d',
+            desc.key,
+            encoded_value,
+            address,
+        )
+        return address, encoded_value
+
+    async def _write_modbus_registers(
+        self,
+        client: AsyncModbusTcpClient,
+        address: int,
+        values: list[int],
+        deadline: float,
+    ) -> None:
+        """Write consecutive registers, retrying while the device is busy."""
+        await self._retry_busy(
+            lambda: self._write_modbus_registers_once(client, address, values),
+            deadline,
+        )
+
+    async def _write_modbus_registers_once(
+        self, client: AsyncModbusTcpClient, address: int, values: list[int]
+    ) -> None:
+        """Write consecutive registers, using a single register write if possible."""
+        try:
+            async with self._request_slot(RequestPriority.WRITE):
+                if len(values) == 1:
+                    regs = await client.write_register(
+                        address=address,
+                        value=values[0],
+                        device_id=int(self._address),
+                    )
+                else:
+                    regs = await client.write_registers(
+                        address=address,
+                        values=values,
+                        device_id=int(self._address),
+                    )
+        except Exception as err:
+            _LOGGER.exception("Exception error")
+            self._record_failure()
+            raise XthermaModbusError from err
+        else:
+            self._record_success()
             if regs.isError():
                 exc_code = regs.exception_code
                 if exc_code == ExcCodes.DEVICE_BUSY:
-                    _LOGGER.error("Device busy")
+                    _LOGGER.debug("Modbus device busy")
                     raise XthermaModbusBusyError
                 _LOGGER.error("Modbus write error %s", exc_code)
                 raise XthermaModbusError
+            # read back the written register sets with the next poll
+            for written in range(address, address + len(values)):
+                self._invalidate_register_set(written)
 
     def _get_register_address(self, key: str) -> int:
         if not self._desc_regset_cache:
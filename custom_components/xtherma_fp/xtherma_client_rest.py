@@ -1,13 +1,16 @@
 """Client to access Fernportal REST API."""
 
 import asyncio
+import hashlib
 import itertools
 import logging
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from email.utils import parsedate_to_datetime
 
 import aiohttp
+from aiohttp import hdrs
 from homeassistant.helpers.entity import EntityDescription
+from homeassistant.util.json import JsonValueType, json_loads
 
 from .const import (
     FERNPORTAL_RATE_LIMIT_S,
@@ -18,22 +21,60 @@ from .const import (
     KEY_SETTINGS,
     KEY_TELEMETRY,
 )
-from .entity_descriptors import ENTITY_DESCRIPTIONS
+from .entity_descriptors import ENTITY_DESCRIPTIONS, XtSensorEntityDescription
+from .rest_budget import get_budget
 from .xtherma_client_common import (
+    Factor,
     XthermaClient,
     XthermaError,
     XthermaReadOnlyError,
     XthermaRestApiError,
     XthermaRestBusyError,
     XthermaTimeoutError,
+    input_factor_function,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _known_keys() -> dict[str, tuple[str, Factor | None]]:
+    known_keys: dict[str, tuple[str, Factor | None]] = {}
+    for desc in ENTITY_DESCRIPTIONS:
+        factor = desc.factor if isinstance(desc, XtSensorEntityDescription) else None
+        known_keys[desc.key] = (factor or "", input_factor_function(factor))
+    return known_keys
+
+
+# Input factors of the keys of entities, with the functions applying them.
+# Fernportal sends the same factors, so they are looked up only if it sends
+# others. Values of other keys are skipped without being converted.
+_KNOWN_KEYS = _known_keys()
+
+
+def _retry_after(err: aiohttp.ClientResponseError) -> float | None:
+    """Return the seconds to wait as sent with a throttled response."""
+    value = err.headers.get(hdrs.RETRY_AFTER) if err.headers else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
 class XthermaClientRest(XthermaClient):
     """REST API access client."""
 
+    # Fernportal rejects requests exceeding its rate limit, so refreshes
+    # requested right after a poll get its result. Regular polls are never
+    # served from the cache.
+    result_cache_s = FERNPORTAL_RATE_LIMIT_S / 2
+
     def __init__(
         self,
         url: str,
@@ -45,56 +86,68 @@ class XthermaClientRest(XthermaClient):
         self._url = f"{url}/{serial_number}"
         self._api_key = api_key
         self._session = session
+        # requests per API key are limited, so all clients share the budget
+        self._budget = get_budget(api_key)
+        self._polling = False
+        # validators of the last response for conditional requests
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        # hash of the last response body and the data parsed from it
+        self._body_hash: bytes | None = None
+        self._last_result: dict[str, int | float] | None = None
 
     def update_interval(self) -> timedelta:
-        """Return update interval for data coordinator."""
-        return timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+        """Return update interval for data coordinator.
+
+        Clients using the same API key share its budget of requests evenly.
+        """
+        return self._budget.poll_interval()
+
+    def next_update_interval(self, update_interval: timedelta) -> timedelta:
+        """Adjust the interval until the next poll to the budget of requests."""
+        return self._budget.next_poll(update_interval)
 
     async def connect(self) -> None:
-        """Not required for REST."""
+        """Start polling with the budget of the API key."""
+        if not self._polling:
+            self._budget.add_poller()
+            self._polling = True
 
     async def disconnect(self) -> None:
-        """Not required for REST."""
+        """Stop polling with the budget of the API key."""
+        if self._polling:
+            self._budget.remove_poller()
+            self._polling = False
 
     def _now(self) -> int:
         return int(datetime.now(UTC).timestamp())
 
-    async def async_get_data(self) -> dict[str, int | float]:
-        """Obtain fresh data."""
-        headers = {"Authorization": f"Bearer {self._api_key}"}
+    async def _async_read_data(self) -> dict[str, int | float]:
+        """Read all data from Fernportal.
+
+        Unchanged data is neither transferred again if Fernportal supports
+        conditional requests, nor parsed again.
+        """
+        self._budget.acquire()
         try:
             timeout = aiohttp.ClientTimeout(total=FERNPORTAL_TIMEOUT_S)
             async with self._session.get(
-                self._url, timeout=timeout, headers=headers
+                self._url, timeout=timeout, headers=self._get_read_headers()
             ) as response:
                 response.raise_for_status()
-                result: dict[str, int | float] = {}
-                json_data: dict[str, Any] = await response.json()
-                telemetry = json_data.get(KEY_TELEMETRY)
-                settings = json_data.get(KEY_SETTINGS)
-                if not isinstance(telemetry, list) or not isinstance(settings, list):
-                    _LOGGER.error("REST API response malformat")
-                    return result
-                for entry in itertools.chain(telemetry, settings):
-                    if (key := entry.get(KEY_ENTRY_KEY)) is None:
-                        continue
-                    if (raw_value := entry.get(KEY_ENTRY_VALUE)) is None:
-                        continue
-                    value = int(raw_value)
-                    if (input_factor := entry.get(KEY_ENTRY_INPUT_FACTOR)) is not None:
-                        value = self._apply_input_factor(value, input_factor)
-                    result[key] = value
-                    _LOGGER.debug(
-                        'key="%s" raw="%s" value="%s" inputfactor="%s"',
-                        key,
-                        raw_value,
-                        value,
-                        input_factor,
-                    )
-                return result
+                if (
+                    response.status == 304  # noqa: PLR2004
+                    and self._last_result is not None
+                ):
+                    _LOGGER.debug("REST API data not modified")
+                    return self._last_result
+                body = await response.read()
+                etag = response.headers.get(hdrs.ETAG)
+                last_modified = response.headers.get(hdrs.LAST_MODIFIED)
         except aiohttp.ClientResponseError as err:
             _LOGGER.debug("API error: %s", err)
             if err.status == 429:  # noqa: PLR2004
+                self._budget.pause(_retry_after(err))
                 raise XthermaRestBusyError from err
             raise XthermaRestApiError(err.status) from err
         except asyncio.exceptions.TimeoutError as err:
@@ -103,7 +156,85 @@ class XthermaClientRest(XthermaClient):
         except Exception as err:
             _LOGGER.debug("Unknown API error %s", err)
             raise XthermaError from err
-        return []
+        result = self._parse_body(body)
+        # only data which could be parsed may be confirmed as not modified
+        self._etag = etag
+        self._last_modified = last_modified
+        return result
+
+    def _get_read_headers(self) -> dict[str, str]:
+        """Return headers of read requests, conditional if possible."""
+        # aiohttp requests compressed responses by default
+        headers = {"Authorization": f"Bearer {self._api_key}"}
+        if self._last_result is not None:
+            if self._etag is not None:
+                headers[hdrs.IF_NONE_MATCH] = self._etag
+            if self._last_modified is not None:
+                headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+        return headers
+
+    def _parse_body(self, body: bytes) -> dict[str, int | float]:
+        """Parse a response body, unless it equals the last one."""
+        body_hash = hashlib.sha256(body).digest()
+        if body_hash == self._body_hash and self._last_result is not None:
+            _LOGGER.debug("REST API data unchanged")
+            return self._last_result
+        try:
+            result = self._parse_data(json_loads(body))
+        except Exception as err:
+            _LOGGER.debug("Unknown API error %s", err)
+            raise XthermaError from err
+        self._body_hash = body_hash
+        self._last_result = result
+        return result
+
+    def _parse_data(self, json_data: JsonValueType) -> dict[str, int | float]:
+        """Parse data from a Fernportal response in a single pass.
+
+        Only values of known keys are converted, others are skipped.
+        """
+        result: dict[str, int | float] = {}
+        if not isinstance(json_data, dict):
+            _LOGGER.error("REST API response malformat")
+            return result
+        telemetry = json_data.get(KEY_TELEMETRY)
+        settings = json_data.get(KEY_SETTINGS)
+        if not isinstance(telemetry, list) or not isinstance(settings, list):
+            _LOGGER.error("REST API response malformat")
+            return result
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for entry in itertools.chain(telemetry, settings):
+            key = entry.get(KEY_ENTRY_KEY)
+            if (known := _KNOWN_KEYS.get(key)) is None:
+                continue
+            if (raw_value := entry.get(KEY_ENTRY_VALUE)) is None:
+                continue
+            value = int(raw_value)
+            input_factor = entry.get(KEY_ENTRY_INPUT_FACTOR) or ""
+            expected_factor, factor = known
+            if input_factor != expected_factor:
+                factor = input_factor_function(input_factor)
+            if factor is not None:
+                value = factor(value)
+            result[key] = value
+            if debug:
+                _LOGGER.debug(
+                    'key="%s" raw="%s" value="%s" inputfactor="%s"',
+                    key,
+                    raw_value,
+                    value,
+                    input_factor,
+                )
+        return result
+
+    async def async_probe(self) -> None:
+        """Check that the API responds by reading the device data.
+
+        Fernportal has no status endpoint, and any request takes the slot of
+        the rate limit. So the probe is a regular read, whose result is
+        returned by the read following it.
+        """
+        await self.async_get_data()
 
     async def async_put_data(self, value: int | float, desc: EntityDescription) -> None:
         """Write data."""
@@ -0,0 +1,103 @@
+"""Benchmark parsing of Fernportal responses.
+
+Compares the current parser with the parsing of the previous read path,
+which decoded the body with `response.json()` and converted each entry
+with `XthermaClient._apply_input_factor`. Run with `scripts/benchmark`.
+"""
+
+import itertools
+import json
+import logging
+import timeit
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+from custom_components.xtherma_fp.const import (
+    FERNPORTAL_URL,
+    KEY_ENTRY_INPUT_FACTOR,
+    KEY_ENTRY_KEY,
+    KEY_ENTRY_VALUE,
+    KEY_SETTINGS,
+    KEY_TELEMETRY,
+)
+from custom_components.xtherma_fp.xtherma_client_common import _FACTORS
+from custom_components.xtherma_fp.xtherma_client_rest import XthermaClientRest
+from tests.const import MOCK_API_KEY, MOCK_SERIAL_NUMBER
+from tests.helpers import load_mock_data
+
+_LOGGER = logging.getLogger(__name__)
+
+_NUMBER = 2000
+_REPEAT = 7
+
+# Entries of parameters without entities added to the canned response.
+_UNKNOWN_ENTRIES = 200
+
+
+def _apply_input_factor(value: int, inputfactor: str | None) -> int | float:
+    """Convert a value as the removed XthermaClient._apply_input_factor did."""
+    if not inputfactor:
+        return value
+    function = _FACTORS.get(inputfactor, lambda v: v)
+    return function(value)
+
+
+def _parse_previous(body: bytes) -> dict[str, int | float]:
+    """Parse as the previous read path did, after receiving the body."""
+    # aiohttp's response.json() decodes with json.loads
+    json_data: dict[str, Any] = json.loads(body)
+    result: dict[str, int | float] = {}
+    telemetry = json_data.get(KEY_TELEMETRY)
+    settings = json_data.get(KEY_SETTINGS)
+    if not isinstance(telemetry, list) or not isinstance(settings, list):
+        _LOGGER.error("REST API response malformat")
+        return result
+    for entry in itertools.chain(telemetry, settings):
+        if (key := entry.get(KEY_ENTRY_KEY)) is None:
+            continue
+        if (raw_value := entry.get(KEY_ENTRY_VALUE)) is None:
+            continue
+        value = int(raw_value)
+        if (input_factor := entry.get(KEY_ENTRY_INPUT_FACTOR)) is not None:
+            value = _apply_input_factor(value, input_factor)
+        result[key] = value
+        _LOGGER.debug(
+            'key="%s" raw="%s" value="%s" inputfactor="%s"',
+            key,
+            raw_value,
+            value,
+            input_factor,
+        )
+    return result
+
+
+def _time_us(function: Any) -> float:
+    """Return the best time of one call in µs."""
+    return min(timeit.repeat(function, number=_NUMBER, repeat=_REPEAT)) / _NUMBER * 1e6
+
+
+def _benchmark(name: str, mock_data: Any) -> None:
+    client = XthermaClientRest(FERNPORTAL_URL, MOCK_API_KEY, MOCK_SERIAL_NUMBER, None)
+    body = json.dumps(mock_data).encode()
+    previous_us = _time_us(lambda: _parse_previous(body))
+    current_us = _time_us(lambda: client._parse_data(json_loads(body)))  # noqa: SLF001
+    print(  # noqa: T201
+        f"{name}: previous {previous_us:.1f} µs, current {current_us:.1f} µs "
+        "per response"
+    )
+
+
+def main() -> None:
+    """Compare the current parser with the previous one."""
+    mock_data: Any = load_mock_data("rest_response.json")
+    _benchmark("canned response", mock_data)
+    mock_data[KEY_SETTINGS].extend(
+        {KEY_ENTRY_KEY: f"u{i}", KEY_ENTRY_VALUE: str(i), KEY_ENTRY_INPUT_FACTOR: ""}
+        for i in range(_UNKNOWN_ENTRIES)
+    )
+    _benchmark(f"with {_UNKNOWN_ENTRIES} unknown keys", mock_data)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Set up some common test helper things."""
 
 import asyncio
+import struct
 from typing import Any, cast
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -24,6 +25,7 @@ from custom_components.xtherma_fp.const import (
     FERNPORTAL_URL,
     VERSION,
 )
+from custom_components.xtherma_fp.xtherma_client_modbus import ModbusRetryPolicy
 from tests.const import (
     MOCK_API_KEY,
     MOCK_CONFIG_ENTRY_ID,
@@ -45,6 +47,31 @@ def auto_enable_custom_integrations(enable_custom_integrations):
     return
 
 
+MODBUS_RETRY_POLICY_PATH = (
+    "custom_components.xtherma_fp.xtherma_client_modbus.DEFAULT_MODBUS_RETRY_POLICY"
+)
+
+
+@pytest.fixture(autouse=True)
+def no_modbus_retry_delay():
+    """Retry busy Modbus requests without delay."""
+    with patch(
+        MODBUS_RETRY_POLICY_PATH,
+        ModbusRetryPolicy(initial_delay_s=0, max_delay_s=0),
+    ):
+        yield
+
+
+REST_BUDGETS_PATH = "custom_components.xtherma_fp.rest_budget._budgets"
+
+
+@pytest.fixture(autouse=True)
+def fresh_rest_budgets():
+    """Start each test with the full budget of Fernportal requests."""
+    with patch.dict(REST_BUDGETS_PATH, clear=True):
+        yield
+
+
 type MockRestParamResponse = JsonValueType
 type MockRestParamHttpError = int | None
 type MockRestParamTimeoutError = bool | None
@@ -123,16 +150,18 @@ async def init_integration(
     return entry
 
 
+type MockModbusParamAddress = int
 type MockModbusParamRegisters = list[int]
 type MockModbusParamExceptionCode = int | None
 type MockModbusParamReadResult = dict[
-    str, MockModbusParamRegisters | MockModbusParamExceptionCode
+    str,
+    MockModbusParamAddress | MockModbusParamRegisters | MockModbusParamExceptionCode,
 ]
 # Type of parameter which mock_modbus_tcp_client expects
 type MockModbusParam = list[MockModbusParamReadResult]
 
 MODBUS_CLIENT_PATH = (
-    "custom_components.xtherma_fp.xtherma_client_modbus.AsyncModbusTcpClient"
+    "custom_components.xtherma_fp.modbus_connection.AsyncModbusTcpClient"
 )
 
 
@@ -145,7 +174,11 @@ async def mock_modbus_tcp_client(request: pytest.FixtureRequest):
 
     MockModbusParam is a list of MockModbusParamReadResults. Each read result
     correspondonds to one call to read_holding_registers() in the modbus client.
+    Results are handed out in order per start address, so a client skipping a
+    range does not shift the data delivered for other ranges. The last result
+    of a range is repeated if it is an error, so retries see the same error.
     A result is a dict with the following keys:
+    "address" -> first register of the range
     "registers" -> register data
     "exc_code" -> exception to be thrown to the client (optional)
     """
@@ -174,7 +207,14 @@ async def mock_modbus_tcp_client(request: pytest.FixtureRequest):
             assert registers_for_this_call is not None
             exc_code = registers_for_this_call.get("exc_code")
             mock_read_holding_registers_result = AsyncMock()
+            mock_read_holding_registers_result.address = registers_for_this_call.get(
+                "address"
+            )
             mock_read_holding_registers_result.registers = reg_list
+            if reg_list is not None:
+                mock_read_holding_registers_result.register_bytes = struct.pack(
+                    f">{len(reg_list)}H", *reg_list
+                )
             if exc_code is not None:
                 mock_read_holding_registers_result.isError = Mock(return_value=True)
                 mock_read_holding_registers_result.exception_code = exc_code
@@ -182,7 +222,20 @@ async def mock_modbus_tcp_client(request: pytest.FixtureRequest):
                 mock_read_holding_registers_result.isError = Mock(return_value=False)
                 mock_read_holding_registers_result.exception_code = 0
             mock_results_queue.append(mock_read_holding_registers_result)
-        mock_instance.read_holding_registers = AsyncMock(side_effect=mock_results_queue)
+
+        def read_holding_registers_side_effect(address, count, device_id):
+            results = [r for r in mock_results_queue if r.address == address]
+            if len(results) == 1 and results[0].exception_code:
+                # the last error for a range is repeated for retries
+                return results[0]
+            for i, result in enumerate(mock_results_queue):
+                if result.address == address:
+                    return mock_results_queue.pop(i)
+            pytest.fail(f"No prepared read result for address {address}")
+
+        mock_instance.read_holding_registers = AsyncMock(
+            side_effect=read_holding_registers_side_effect
+        )
 
         # When `close` is called, it should change the `connected` property back to False.
         def close_side_effect():
@@ -195,6 +248,9 @@ async def mock_modbus_tcp_client(request: pytest.FixtureRequest):
         mock_instance.write_register = AsyncMock(
             return_value=mock_write_register_result
         )
+        mock_instance.write_registers = AsyncMock(
+            return_value=mock_write_register_result
+        )
 
         # Mock the `close` method, as it might be called during component teardown or error handling.
         mock_instance.close = Mock(side_effect=close_side_effect)
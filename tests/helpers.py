@@ -21,9 +21,9 @@ from custom_components.xtherma_fp.const import (
 )
 from custom_components.xtherma_fp.entity_descriptors import (
     MODBUS_ENTITY_DESCRIPTIONS,
-    MODBUS_REGISTER_RANGES,
     MODBUS_REGISTER_SIZE,
 )
+from custom_components.xtherma_fp.modbus_plan import MODBUS_REGISTER_RANGES
 from tests.conftest import (
     MockModbusParam,
     MockModbusParamExceptionCode,
@@ -122,7 +122,8 @@ def provide_modbus_data(
     for entry in all_values:
         key = entry[KEY_ENTRY_KEY]
         value = int(str(entry[KEY_ENTRY_VALUE]))
-        set_modbus_register(regs_list, key, value)
+        # registers hold 16 bit words, negative values in two's complement
+        set_modbus_register(regs_list, key, value & 0xFFFF)
 
     # The rest data does not define these values
     set_modbus_register(regs_list, "in_total", 0)
@@ -143,6 +144,7 @@ def provide_empty_modbus_data(
     for r in MODBUS_REGISTER_RANGES:
         regs_list.append(
             {
+                "address": r.first_reg,
                 "registers": raw_registers[r.first_reg : r.last_reg + 1],
                 "exc_code": exc_code,
             }
@@ -0,0 +1,131 @@
+"""Tests for the circuit breaker stopping polls of offline devices."""
+
+from datetime import timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.xtherma_fp.circuit_breaker import (
+    _PROBE_INTERVAL_MAX_S,
+    CircuitBreaker,
+)
+from custom_components.xtherma_fp.const import FERNPORTAL_RATE_LIMIT_S, FERNPORTAL_URL
+from custom_components.xtherma_fp.modbus_plan import MODBUS_REGISTER_RANGES
+from custom_components.xtherma_fp.vendor.pymodbus import ModbusException
+from tests.const import MOCK_SERIAL_NUMBER
+from tests.helpers import load_mock_data, provide_modbus_data
+
+from .conftest import init_integration, init_modbus_integration
+
+if TYPE_CHECKING:
+    from custom_components.xtherma_fp import XthermaData
+
+
+def test_circuit_breaker_probe_interval(freezer):
+    """Verify that probe intervals grow while the device stays offline."""
+    breaker = CircuitBreaker(probe_interval_s=30, failure_threshold=2)
+    breaker.record_failure()
+    assert not breaker.is_open
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.probe_due()
+
+    freezer.tick(timedelta(seconds=30))
+    assert breaker.probe_due()
+    breaker.record_failure()
+    freezer.tick(timedelta(seconds=30))
+    assert not breaker.probe_due()
+    freezer.tick(timedelta(seconds=30))
+    assert breaker.probe_due()
+
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+def _single_register_result() -> Mock:
+    result = Mock()
+    result.isError = Mock(return_value=False)
+    result.register_bytes = b"\x00\x01"
+    return result
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", [provide_modbus_data()[0] * 2], indirect=True
+)
+async def test_circuit_breaker_modbus(hass, freezer, mock_modbus_tcp_client):
+    """Verify that an offline device is only probed until it responds."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    read = mock_modbus_tcp_client.read_holding_registers
+    serve_prepared_data = read.side_effect
+
+    # the device stops responding
+    read.side_effect = ModbusException("timeout")
+    for _ in range(3):
+        await coordinator.async_refresh()
+    read.reset_mock()
+
+    # no requests are sent until a probe is due
+    await coordinator.async_refresh()
+    assert coordinator.last_exception.translation_key == "device_offline_error"
+    read.assert_not_called()
+
+    # a failed probe reads a single register
+    freezer.tick(timedelta(seconds=30))
+    await coordinator.async_refresh()
+    assert read.call_count == 1
+    assert read.call_args.kwargs["count"] == 1
+
+    # the device responds again, the successful probe resumes full polls
+    def respond(address: int, count: int, device_id: int) -> Mock:
+        if count == 1:
+            return _single_register_result()
+        return serve_prepared_data(address, count, device_id)
+
+    read.side_effect = respond
+    read.reset_mock()
+    freezer.tick(timedelta(seconds=60))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    # probe and telemetry range, settings are not yet due
+    assert [call.kwargs["count"] for call in read.call_args_list] == [
+        1,
+        MODBUS_REGISTER_RANGES[-1].length,
+    ]
+
+
+async def test_circuit_breaker_rest(hass, freezer, aioclient_mock):
+    """Verify that Fernportal is polled again once it responds."""
+    mock_data = load_mock_data("rest_response.json")
+    url = f"{FERNPORTAL_URL}/{MOCK_SERIAL_NUMBER}"
+    aioclient_mock.get(url, json=mock_data)
+    entry = await init_integration(hass, None)
+    coordinator = entry.runtime_data.coordinator
+    breaker = coordinator._breaker  # noqa: SLF001
+
+    # Fernportal fails until the breaker opens, and for one probe
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+    for _ in range(4):
+        freezer.tick(timedelta(seconds=_PROBE_INTERVAL_MAX_S))
+        await coordinator.async_refresh()
+    assert breaker.is_open
+    assert not coordinator.last_update_success
+
+    # the probe reads the data, which the update uses
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, json=mock_data)
+    freezer.tick(timedelta(seconds=_PROBE_INTERVAL_MAX_S))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not breaker.is_open
+    assert aioclient_mock.call_count == 1
+    assert aioclient_mock.mock_calls[0][0] == "GET"
+
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert aioclient_mock.call_count == 2
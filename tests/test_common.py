@@ -9,6 +9,11 @@ from custom_components.xtherma_fp.entity_descriptors import (
     MODBUS_ENTITY_DESCRIPTIONS,
     XtNumericEntityDescription,
 )
+from custom_components.xtherma_fp.xtherma_client_common import (
+    _FACTORS,
+    _RFACTORS,
+    FACTOR_SCALES,
+)
 from tests.helpers import (
     flatten_mock_data,
     load_mock_data,
@@ -61,3 +66,14 @@ def test_input_factors():
             assert (not input_factor and not desc.factor) or (
                 input_factor == desc.factor
             )
+
+
+@pytest.mark.parametrize("factor", FACTOR_SCALES)
+def test_input_factor_functions(factor):
+    """Verify that the functions of input factors follow their scales."""
+    multiplier, divisor = FACTOR_SCALES[factor]
+    value = _FACTORS[factor](12)
+    assert value == 12 * multiplier / divisor
+    # values are only converted to float if divided
+    assert isinstance(value, int) == (divisor == 1)
+    assert _RFACTORS[factor](value) == 12
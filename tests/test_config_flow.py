@@ -30,8 +30,12 @@ from custom_components.xtherma_fp.const import (
     CONF_CONNECTION_RESTAPI,
     CONF_DETECT_EMPTY_MODBUS_DATA,
     CONF_SERIAL_NUMBER,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_STANDBY_UPDATE_INTERVAL,
     FERNPORTAL_URL,
 )
+from custom_components.xtherma_fp.modbus_connection import _connection_users
+from custom_components.xtherma_fp.vendor.pymodbus import ModbusException
 from custom_components.xtherma_fp.xtherma_client_common import (
     XthermaError,
     XthermaNotConnectedError,
@@ -264,6 +268,42 @@ async def test_step_modbus_tcp_abort_entries_match(hass, mock_modbus_tcp_client)
     assert result["reason"] == "already_configured"
 
 
+# data is read by each of the two entries
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", [provide_modbus_data()[0] * 2], indirect=True
+)
+async def test_step_modbus_tcp_other_address(hass, mock_modbus_tcp_client):
+    """Test for heat pumps sharing a gateway with different unit addresses."""
+    await init_modbus_integration(hass, mock_modbus_tcp_client)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_USER},
+        data={
+            CONF_NAME: MOCK_NAME,
+            CONF_SERIAL_NUMBER: "FP-04-000000",
+            CONF_CONNECTION: CONF_CONNECTION_MODBUSTCP,
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "modbus_tcp"
+
+    with patch(
+        "custom_components.xtherma_fp.config_flow._validate_modbus_tcp", return_value={}
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                CONF_HOST: MOCK_MODBUS_HOST,
+                CONF_PORT: MOCK_MODBUS_PORT,
+                CONF_ADDRESS: MOCK_MODBUS_ADDRESS + 1,
+            },
+        )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_ADDRESS] == MOCK_MODBUS_ADDRESS + 1
+    assert len(hass.config_entries.async_entries(DOMAIN)) == 2
+
+
 @pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
 async def test_step_reconfigure_rest_api(hass, mock_rest_api_client):
     """Test for reconfiguring to rest api."""
@@ -386,6 +426,47 @@ async def test_step_reconfigure_modbus(hass, mock_rest_api_client):
     }
 
 
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+async def test_step_reconfigure_modbus_fallback(hass, mock_rest_api_client):
+    """Test for reconfiguring to modbus, falling back to the REST API."""
+    entry = await init_integration(hass, mock_rest_api_client)
+
+    reconfigure_result = await entry.start_reconfigure_flow(hass)
+    reconfigure_result = await hass.config_entries.flow.async_configure(
+        reconfigure_result["flow_id"],
+        {
+            CONF_SERIAL_NUMBER: MOCK_SERIAL_NUMBER,
+            CONF_CONNECTION: CONF_CONNECTION_MODBUSTCP,
+        },
+    )
+    assert reconfigure_result["type"] is FlowResultType.FORM
+
+    with (
+        patch(
+            "custom_components.xtherma_fp.config_flow._validate_modbus_tcp",
+            return_value={},
+        ),
+        patch(
+            "custom_components.xtherma_fp.config_flow._validate_rest_api",
+            return_value={},
+        ) as validate_rest_api,
+    ):
+        reconfigure_result = await hass.config_entries.flow.async_configure(
+            reconfigure_result["flow_id"],
+            {
+                CONF_HOST: MOCK_MODBUS_HOST,
+                CONF_PORT: MOCK_MODBUS_PORT,
+                CONF_ADDRESS: MOCK_MODBUS_ADDRESS,
+                CONF_API_KEY: MOCK_API_KEY,
+            },
+        )
+    assert reconfigure_result["type"] is FlowResultType.ABORT
+    assert reconfigure_result["reason"] == "reconfigure_successful"
+    validate_rest_api.assert_called_once()
+    assert entry.data[CONF_CONNECTION] == CONF_CONNECTION_MODBUSTCP
+    assert entry.data[CONF_API_KEY] == MOCK_API_KEY
+
+
 @pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
 async def test_step_reconfigure_modbus_errors(hass, mock_rest_api_client):
     """Test for reconfiguring to modbus with errors."""
@@ -481,6 +562,25 @@ async def test_validate_modbus_tcp(hass, data, side_effect, expected_errors):
         assert await _validate_modbus_tcp(hass, data) == expected_errors
 
 
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+@pytest.mark.parametrize("failure", ["connect", "read"])
+async def test_validate_modbus_tcp_releases_connection(
+    hass, mock_modbus_tcp_client, failure
+):
+    """Test that failed validations do not keep the connection open."""
+    if failure == "connect":
+        mock_modbus_tcp_client.connect.side_effect = None
+        mock_modbus_tcp_client.connect.return_value = False
+    else:
+        mock_modbus_tcp_client.read_holding_registers.side_effect = ModbusException(
+            "timeout"
+        )
+
+    assert await _validate_modbus_tcp(hass, MOCK_MODBUS_DATA)
+    assert (MOCK_MODBUS_HOST, MOCK_MODBUS_PORT) not in _connection_users
+    mock_modbus_tcp_client.close.assert_called_once()
+
+
 @pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
 async def test_options_flow(hass, mock_modbus_tcp_client):
     """Test options flow."""
@@ -507,7 +607,11 @@ async def test_options_flow(hass, mock_modbus_tcp_client):
 
         result = await hass.config_entries.options.async_configure(
             result["flow_id"],
-            user_input={CONF_DETECT_EMPTY_MODBUS_DATA: value_to_set},
+            user_input={
+                CONF_DETECT_EMPTY_MODBUS_DATA: value_to_set,
+                CONF_STALE_GRACE_PERIOD: 60 if value_to_set else 0,
+                CONF_STANDBY_UPDATE_INTERVAL: 600 if value_to_set else 0,
+            },
         )
 
         # check config result
@@ -517,3 +621,5 @@ async def test_options_flow(hass, mock_modbus_tcp_client):
         # check that update_options_listener() was called and has applied
         # the new setting
         assert client.detect_empty_modbus_data == value_to_set
+        assert coordinator.stale_grace_period == (60 if value_to_set else 0)
+        assert coordinator.standby_update_interval == (600 if value_to_set else 0)
@@ -0,0 +1,22 @@
+"""Tests for diagnostics."""
+
+import pytest
+from syrupy.assertion import SnapshotAssertion
+
+from custom_components.xtherma_fp.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from tests.helpers import provide_modbus_data
+
+from .conftest import init_modbus_integration
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_diagnostics_modbus(
+    hass, mock_modbus_tcp_client, snapshot: SnapshotAssertion
+):
+    """Test diagnostics of a Modbus entry."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics == snapshot
@@ -0,0 +1,148 @@
+"""Tests for the shared Modbus connections."""
+
+import asyncio
+from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.xtherma_fp.modbus_connection import (
+    ModbusConnectionState,
+    RequestPriority,
+    _FairSlots,
+    reconnect_delay,
+)
+from custom_components.xtherma_fp.vendor.pymodbus import ModbusException
+from custom_components.xtherma_fp.xtherma_client_modbus import XthermaClientModbus
+from tests.helpers import provide_modbus_data
+
+from .conftest import init_modbus_integration
+
+if TYPE_CHECKING:
+    from custom_components.xtherma_fp import XthermaData
+
+RECONNECT_DELAY_PATH = "custom_components.xtherma_fp.modbus_connection.reconnect_delay"
+
+
+def test_reconnect_delay():
+    """Verify reconnect delays grow exponentially up to a maximum."""
+    assert 0.8 <= reconnect_delay(0) <= 1.2
+    assert 3.2 <= reconnect_delay(2) <= 4.8
+    assert 240 <= reconnect_delay(20) <= 360
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_connection_background_reconnect(hass, mock_modbus_tcp_client):
+    """Verify that a lost connection is restored in background."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    client = cast("XthermaClientModbus", coordinator._client)  # noqa: SLF001
+    assert client.connection_state == ModbusConnectionState.CONNECTED
+    assert mock_modbus_tcp_client.connect.call_count == 1
+
+    # lose connection, the next poll fails without waiting for a reconnect
+    mock_modbus_tcp_client.close()
+    assert client.connection_state == ModbusConnectionState.DOWN
+    with patch(RECONNECT_DELAY_PATH, return_value=0):
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert coordinator.last_exception.translation_key == "not_connected_error"
+
+        reconnect_task = client._connection._reconnect_task  # noqa: SLF001
+        assert reconnect_task is not None
+        await reconnect_task
+
+    assert client.connection_state == ModbusConnectionState.CONNECTED
+    assert mock_modbus_tcp_client.connect.call_count == 2
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_connection_degraded(hass, mock_modbus_tcp_client):
+    """Verify that failing requests degrade the connection state."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    client = cast("XthermaClientModbus", coordinator._client)  # noqa: SLF001
+
+    mock_modbus_tcp_client.read_holding_registers.side_effect = ModbusException(
+        "timeout"
+    )
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert client.connection_state == ModbusConnectionState.DEGRADED
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_connection_shared_by_devices(hass, mock_modbus_tcp_client):
+    """Verify that devices behind one gateway share a connection."""
+    client_1 = XthermaClientModbus(host="gateway", port=502, address=1)
+    client_2 = XthermaClientModbus(host="gateway", port=502, address=2)
+    await client_1.connect()
+    await client_2.connect()
+    assert client_1._connection is client_2._connection  # noqa: SLF001
+    assert mock_modbus_tcp_client.connect.call_count == 1
+
+    # errors of one device do not affect the other
+    client_1._record_failure()  # noqa: SLF001
+    assert client_1.connection_state == ModbusConnectionState.DEGRADED
+    assert client_2.connection_state == ModbusConnectionState.CONNECTED
+
+    # the connection is closed when the last client disconnects
+    await client_1.disconnect()
+    mock_modbus_tcp_client.close.assert_not_called()
+    await client_2.disconnect()
+    mock_modbus_tcp_client.close.assert_called_once()
+
+
+async def test_request_slots_served_in_turn():
+    """Verify that waiting devices take turns."""
+    slots = _FairSlots(1)
+    order: list[int] = []
+
+    async def request(device_id: int) -> None:
+        await slots.acquire(device_id, RequestPriority.TELEMETRY)
+        order.append(device_id)
+        await asyncio.sleep(0)
+        slots.release()
+
+    await slots.acquire(0, RequestPriority.TELEMETRY)
+    tasks = [
+        asyncio.create_task(request(device_id)) for device_id in (1, 1, 1, 2, 2, 3)
+    ]
+    await asyncio.sleep(0)
+    slots.release()
+    await asyncio.gather(*tasks)
+    assert order == [1, 2, 3, 1, 2, 1]
+
+
+async def test_request_slots_served_by_priority():
+    """Verify that writes are sent before waiting polls."""
+    slots = _FairSlots(1)
+    order: list[RequestPriority] = []
+
+    async def request(priority: RequestPriority) -> None:
+        await slots.acquire(1, priority)
+        order.append(priority)
+        await asyncio.sleep(0)
+        slots.release()
+
+    await slots.acquire(1, RequestPriority.SETTINGS)
+    tasks = [
+        asyncio.create_task(request(priority))
+        for priority in (
+            RequestPriority.SETTINGS,
+            RequestPriority.TELEMETRY,
+            RequestPriority.CONFIRM,
+            RequestPriority.WRITE,
+        )
+    ]
+    await asyncio.sleep(0)
+    slots.release()
+    await asyncio.gather(*tasks)
+    assert order == [
+        RequestPriority.WRITE,
+        RequestPriority.CONFIRM,
+        RequestPriority.TELEMETRY,
+        RequestPriority.SETTINGS,
+    ]
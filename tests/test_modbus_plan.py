@@ -0,0 +1,148 @@
+"""Tests for the Modbus read and decode planner."""
+
+import struct
+from typing import TYPE_CHECKING, cast
+
+import pytest
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.xtherma_fp.entity_descriptors import (
+    MODBUS_ENTITY_DESCRIPTIONS,
+    ModbusRegisterSet,
+    XtSensorEntityDescription,
+    XtSwitchEntityDescription,
+)
+from custom_components.xtherma_fp.modbus_plan import (
+    MODBUS_MAX_READ_COUNT,
+    MODBUS_REGISTER_RANGES,
+    compile_decode_plan,
+    plan_read_ranges,
+)
+from tests.helpers import get_modbus_register_number, provide_modbus_data
+
+from .conftest import init_modbus_integration
+
+if TYPE_CHECKING:
+    from custom_components.xtherma_fp import XthermaData
+    from custom_components.xtherma_fp.xtherma_client_modbus import (
+        XthermaClientModbus,
+    )
+
+BINARY_SENSOR_ENTITY_ID_MODBUS_PWW = "binary_sensor.test_entry_xtherma_modbus_config_pww_circulation_pump_hot_water_enabled"
+
+
+def _register_set(base: int, count: int) -> ModbusRegisterSet:
+    return ModbusRegisterSet(
+        base=base,
+        descriptors=[
+            XtSensorEntityDescription(key=f"{base + i}") for i in range(count)
+        ],
+    )
+
+
+def _spans(reg_descs: list[ModbusRegisterSet], **kwargs) -> list[tuple[int, int]]:
+    return [(r.first_reg, r.last_reg) for r in plan_read_ranges(reg_descs, **kwargs)]
+
+
+def test_plan_default_ranges():
+    """Verify the plan for all registers."""
+    assert [(r.first_reg, r.last_reg) for r in MODBUS_REGISTER_RANGES] == [
+        (0, 64),
+        (100, 193),
+    ]
+    for r in MODBUS_REGISTER_RANGES:
+        assert r.length <= MODBUS_MAX_READ_COUNT
+
+
+def test_plan_bridges_small_gaps():
+    """Verify that small gaps are read along."""
+    reg_descs = [_register_set(0, 5), _register_set(10, 5)]
+    assert _spans(reg_descs, request_cost=10) == [(0, 14)]
+
+
+def test_plan_splits_large_gaps():
+    """Verify that large gaps are skipped."""
+    reg_descs = [_register_set(0, 5), _register_set(50, 5)]
+    assert _spans(reg_descs, request_cost=10) == [(0, 4), (50, 54)]
+
+
+def test_plan_respects_max_count():
+    """Verify that no range exceeds the maximum register count."""
+    reg_descs = [_register_set(0, 100), _register_set(100, 100)]
+    spans = _spans(reg_descs)
+    assert spans[0][0] == 0
+    assert spans[-1][1] == 199
+    for first_reg, last_reg in spans:
+        assert last_reg - first_reg + 1 <= MODBUS_MAX_READ_COUNT
+
+
+def test_plan_disabled_keys():
+    """Verify that registers of disabled keys are not read."""
+    disabled_keys = {
+        desc.key
+        for reg_desc in MODBUS_ENTITY_DESCRIPTIONS
+        if reg_desc.base < 100
+        for desc in reg_desc.descriptors
+        if desc is not None
+    }
+    ranges = plan_read_ranges(MODBUS_ENTITY_DESCRIPTIONS, disabled_keys=disabled_keys)
+    assert len(ranges) == 1
+    assert ranges[0].first_reg == 100
+    assert ranges[0].non_empty_reg == get_modbus_register_number("controller_v")
+
+
+def test_plan_without_non_empty_register():
+    """Verify that ranges without a known non-empty register skip detection."""
+    ranges = plan_read_ranges([_register_set(0, 5)])
+    assert len(ranges) == 1
+    assert ranges[0].non_empty_reg is None
+
+
+def test_decode_plan():
+    """Verify signedness and factors of a compiled decode plan."""
+    reg_desc = ModbusRegisterSet(
+        base=10,
+        descriptors=[
+            XtSensorEntityDescription(key="temp", factor="/10"),
+            XtSensorEntityDescription(key="power", factor="*100"),
+            None,
+            XtSensorEntityDescription(key="mode", device_class=SensorDeviceClass.ENUM),
+            XtSwitchEntityDescription(key="switch"),
+        ],
+    )
+    plan = compile_decode_plan(reg_desc)
+    assert plan.keys == ("temp", "power", "mode", "switch")
+
+    image = struct.pack(">15H", *([0] * 10), 65535 - 54, 3, 7, 65535, 1)
+    result: dict[str, int | float] = {}
+    plan.decode(image, result)
+    assert result == {"temp": -5.5, "power": 300, "mode": 65535, "switch": 1}
+
+
+def test_decode_plan_disabled_keys():
+    """Verify that disabled keys are not decoded."""
+    reg_desc = _register_set(0, 3)
+    plan = compile_decode_plan(reg_desc, disabled_keys={"1"})
+    result: dict[str, int | float] = {}
+    plan.decode(struct.pack(">3H", 1, 2, 3), result)
+    assert result == {"0": 1, "2": 3}
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_plan_follows_disabled_entities(
+    hass, entity_registry, mock_modbus_tcp_client
+):
+    """Verify that disabling an entity updates the client's read plan."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    client = cast("XthermaClientModbus", xtherma_data.coordinator._client)  # noqa: SLF001
+    assert not client._disabled_keys  # noqa: SLF001
+
+    entity_registry.async_update_entity(
+        BINARY_SENSOR_ENTITY_ID_MODBUS_PWW,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    await hass.async_block_till_done()
+
+    assert client._disabled_keys == {"pww"}  # noqa: SLF001
@@ -1,5 +1,6 @@
 """Tests for the Xtherma number platform."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -12,7 +13,14 @@ from pytest_homeassistant_custom_component.common import snapshot_platform
 from custom_components.xtherma_fp.xtherma_client_common import XthermaReadOnlyError
 from tests.helpers import provide_modbus_data, provide_rest_data
 
-from .conftest import init_integration, init_modbus_integration
+from .conftest import MockModbusParam, init_integration, init_modbus_integration
+
+CONFIRM_DELAYS_PATH = "custom_components.xtherma_fp.coordinator._WRITE_CONFIRM_DELAYS_S"
+SETTLE_TIME_PATH = "custom_components.xtherma_fp.coordinator._WRITE_SETTLE_TIME_S"
+RECONNECT_DELAY_PATH = "custom_components.xtherma_fp.modbus_connection.reconnect_delay"
+DEPENDENTS_DELAYS_PATH = (
+    "custom_components.xtherma_fp.coordinator._DEPENDENTS_READ_DELAYS_S"
+)
 
 NUMBER_ENTITY_ID_451 = (
     "number.test_entry_xtherma_config_cooling_curve_2_outside_temperature_low_p1"
@@ -20,9 +28,19 @@ NUMBER_ENTITY_ID_451 = (
 NUMBER_ENTITY_ID_MODBUS_451 = (
     "number.test_entry_xtherma_modbus_config_cooling_curve_2_outside_temperature_low_p1"
 )
+NUMBER_ENTITY_ID_MODBUS_311 = (
+    "number.test_entry_xtherma_modbus_config_heating_curve_1_outside_temperature_low_p1"
+)
+NUMBER_ENTITY_ID_MODBUS_315 = (
+    "number.test_entry_xtherma_modbus_config_heating_curve_1_heating_temperature_low_p1"
+)
+NUMBER_ENTITY_ID_MODBUS_316 = "number.test_entry_xtherma_modbus_config_heating_curve_1_heating_temperature_high_p2"
 NUMBER_ENTITY_ID_MODBUS_411 = (
     "number.test_entry_xtherma_modbus_config_heating_curve_2_outside_temperature_low_p1"
 )
+SENSOR_ENTITY_ID_MODBUS_C_TARGET = (
+    "sensor.test_entry_xtherma_modbus_config_target_cooling_operation"
+)
 
 
 @pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
@@ -88,6 +106,33 @@ async def test_set_number_modbus(hass, mock_modbus_tcp_client):
     assert kwargs["device_id"] == 1
 
 
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+# a failed write while not connected shows the value of the device again
+async def test_set_number_not_connected_modbus(hass, mock_modbus_tcp_client):
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    client = entry.runtime_data.coordinator._client  # noqa: SLF001
+    state = hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state
+
+    mock_modbus_tcp_client.close()
+    with (
+        patch(RECONNECT_DELAY_PATH, return_value=0),
+        pytest.raises(HomeAssistantError, match="Not connected"),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_VALUE,
+            {
+                ATTR_ENTITY_ID: NUMBER_ENTITY_ID_MODBUS_451,
+                ATTR_VALUE: 16.0,
+            },
+            blocking=True,
+        )
+    await client._connection._reconnect_task  # noqa: SLF001
+
+    mock_modbus_tcp_client.write_register.assert_not_called()
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == state
+
+
 # check writing negative values as 2s complement
 @pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
 async def test_set_negative_number_modbus(hass, mock_modbus_tcp_client):
@@ -109,3 +154,203 @@ async def test_set_negative_number_modbus(hass, mock_modbus_tcp_client):
     assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_411).state == "-20"
     assert kwargs["value"] == (20 ^ 65535) + 1
     assert kwargs["device_id"] == 1
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+# check writes of adjacent registers are combined
+async def test_set_numbers_coalesced_modbus(hass, mock_modbus_tcp_client):
+    await init_modbus_integration(hass, mock_modbus_tcp_client)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_VALUE,
+        {
+            ATTR_ENTITY_ID: [
+                NUMBER_ENTITY_ID_MODBUS_311,
+                NUMBER_ENTITY_ID_MODBUS_315,
+                NUMBER_ENTITY_ID_MODBUS_316,
+            ],
+            ATTR_VALUE: 22.0,
+        },
+        blocking=True,
+    )
+
+    # register 11 is written alone, registers 13 and 14 in one request
+    kwargs = mock_modbus_tcp_client.write_register.call_args.kwargs
+    assert mock_modbus_tcp_client.write_register.call_count == 1
+    assert kwargs["address"] == 11
+    assert kwargs["value"] == 22
+    kwargs = mock_modbus_tcp_client.write_registers.call_args.kwargs
+    assert mock_modbus_tcp_client.write_registers.call_count == 1
+    assert kwargs["address"] == 13
+    assert kwargs["values"] == [22, 22]
+    assert kwargs["device_id"] == 1
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_315).state == "22"
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+# a burst of writes to one number only writes the last value
+async def test_set_number_burst_modbus(hass, mock_modbus_tcp_client):
+    await init_modbus_integration(hass, mock_modbus_tcp_client)
+
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                DOMAIN,
+                SERVICE_SET_VALUE,
+                {ATTR_ENTITY_ID: NUMBER_ENTITY_ID_MODBUS_311, ATTR_VALUE: value},
+                blocking=True,
+            )
+            for value in (20.0, 21.0, 22.0)
+        )
+    )
+
+    mock_modbus_tcp_client.write_register.assert_called_once()
+    assert mock_modbus_tcp_client.write_register.call_args.kwargs["value"] == 22
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_311).state == "22"
+
+
+def _test_set_numbers_cancelled_regs() -> list[MockModbusParam]:
+    # initial data and the read back values of registers 11 and 41
+    param = provide_modbus_data()
+    param[0].append({"address": 11, "registers": [22]})
+    param[0].append({"address": 41, "registers": [16]})
+    return param
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", _test_set_numbers_cancelled_regs(), indirect=True
+)
+# a caller cancelled while its write is queued does not affect the batch
+async def test_set_numbers_cancelled_modbus(hass, mock_modbus_tcp_client):
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+
+    def set_value(entity_id: str, value: float) -> asyncio.Task:
+        return hass.async_create_task(
+            hass.services.async_call(
+                DOMAIN,
+                SERVICE_SET_VALUE,
+                {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: value},
+                blocking=True,
+            )
+        )
+
+    with patch(CONFIRM_DELAYS_PATH, (0,)), patch(DEPENDENTS_DELAYS_PATH, ()):
+        cancelled = set_value(NUMBER_ENTITY_ID_MODBUS_311, 22.0)
+        written = set_value(NUMBER_ENTITY_ID_MODBUS_451, 16.0)
+        await asyncio.sleep(0)
+        assert coordinator._write_queue  # noqa: SLF001
+        cancelled.cancel()
+        async with asyncio.timeout(5):
+            await written
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert cancelled.cancelled()
+    assert mock_modbus_tcp_client.write_register.call_count == 2
+    assert not coordinator._pending_writes  # noqa: SLF001
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == "16"
+
+
+def _test_set_number_read_back_regs(value: int) -> list[MockModbusParam]:
+    # initial data and the read back value of register 41
+    param = provide_modbus_data()
+    param[0].append({"address": 41, "registers": [value]})
+    return param
+
+
+def _test_set_number_dependents_regs() -> list[MockModbusParam]:
+    # additionally the derived cooling targets c_target and c2_target
+    param = _test_set_number_read_back_regs(16)
+    param[0].append({"address": 113, "registers": [160]})
+    param[0].append({"address": 115, "registers": [160]})
+    return param
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", _test_set_number_dependents_regs(), indirect=True
+)
+# check the device confirms a written value, and derived values are read
+async def test_set_number_confirmed_modbus(hass, mock_modbus_tcp_client):
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+    assert hass.states.get(SENSOR_ENTITY_ID_MODBUS_C_TARGET).state == "20.0"
+    mock_modbus_tcp_client.read_holding_registers.reset_mock()
+
+    with patch(CONFIRM_DELAYS_PATH, (0,)), patch(DEPENDENTS_DELAYS_PATH, (0,)):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_VALUE,
+            {
+                ATTR_ENTITY_ID: NUMBER_ENTITY_ID_MODBUS_451,
+                ATTR_VALUE: 16.0,
+            },
+            blocking=True,
+        )
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    # only the written register and the derived ones are read
+    reads = [
+        (call.kwargs["address"], call.kwargs["count"])
+        for call in mock_modbus_tcp_client.read_holding_registers.call_args_list
+    ]
+    assert reads == [(41, 1), (113, 1), (115, 1)]
+    assert not coordinator._pending_writes  # noqa: SLF001
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == "16"
+    assert hass.states.get(SENSOR_ENTITY_ID_MODBUS_C_TARGET).state == "16.0"
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", _test_set_number_read_back_regs(3), indirect=True
+)
+# check a written value the device does not accept
+async def test_set_number_rejected_modbus(hass, mock_modbus_tcp_client, caplog):
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+
+    with patch(CONFIRM_DELAYS_PATH, (0,)):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_VALUE,
+            {
+                ATTR_ENTITY_ID: NUMBER_ENTITY_ID_MODBUS_451,
+                ATTR_VALUE: 16.0,
+            },
+            blocking=True,
+        )
+        assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == "16"
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not coordinator._pending_writes  # noqa: SLF001
+    assert 'Device did not accept value 16 for "451"' in caplog.text
+    # the entity shows the value used by the device again
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == "3"
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", _test_set_number_read_back_regs(3), indirect=True
+)
+# check a rejected value is detected after reads are no longer blocked
+async def test_set_number_rejected_after_settle_modbus(
+    hass, mock_modbus_tcp_client, caplog
+):
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+
+    with patch(CONFIRM_DELAYS_PATH, (0,)), patch(SETTLE_TIME_PATH, -1):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_VALUE,
+            {
+                ATTR_ENTITY_ID: NUMBER_ENTITY_ID_MODBUS_451,
+                ATTR_VALUE: 16.0,
+            },
+            blocking=True,
+        )
+        # an update after the settle time does not end the confirmation
+        assert coordinator._is_blocked("451") is None  # noqa: SLF001
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not coordinator._pending_writes  # noqa: SLF001
+    assert 'Device did not accept value 16 for "451"' in caplog.text
+    assert hass.states.get(NUMBER_ENTITY_ID_MODBUS_451).state == "3"
@@ -0,0 +1,55 @@
+"""Tests for aligning polls with the refresh of device values."""
+
+import time
+from datetime import timedelta
+
+from custom_components.xtherma_fp.refresh_phase import RefreshPhase
+
+# the simulated device refreshes its values at this second of each period
+_DEVICE_PHASE_S = 10.0
+_PERIOD_S = 30.0
+
+
+def _refreshed_between(start: float, end: float) -> bool:
+    return (end - _DEVICE_PHASE_S) // _PERIOD_S > (start - _DEVICE_PHASE_S) // _PERIOD_S
+
+
+def test_refresh_phase_locks(freezer):
+    """Verify that polls converge to just after the device refresh."""
+    phase = RefreshPhase(_PERIOD_S)
+    start = time.monotonic()
+    last_poll = start - _PERIOD_S
+    polls = 0
+    while time.monotonic() - start < 20 * _PERIOD_S:
+        now = time.monotonic()
+        phase.record_poll(now, changed=_refreshed_between(last_poll, now))
+        last_poll = now
+        polls += 1
+        freezer.tick(timedelta(seconds=phase.next_delay()))
+
+    # polls happen just after the refresh, at the usual rate
+    assert phase.is_locked
+    delay = phase.next_delay()
+    poll_phase = (time.monotonic() + delay - _DEVICE_PHASE_S) % _PERIOD_S
+    assert 0 < poll_phase <= 3
+    assert 18 <= polls <= 22
+
+
+def test_refresh_phase_lost(freezer):
+    """Verify that polls contradicting the refresh time start learning again."""
+    phase = RefreshPhase(_PERIOD_S)
+    now = time.monotonic()
+    phase.record_poll(now, changed=True)
+    phase.record_poll(now + 30, changed=True)
+    # the probe in the middle of the window sees no refresh
+    phase.record_poll(now + 45, changed=False)
+    phase.record_poll(now + 61, changed=True)
+    assert phase._window == (now + 45, now + 60)  # noqa: SLF001
+
+    # a single poll without changes may have missed them
+    phase.record_poll(now + 91, changed=False)
+    assert phase._window is not None  # noqa: SLF001
+    phase.record_poll(now + 121, changed=False)
+    freezer.tick(timedelta(seconds=121))
+    assert not phase.is_locked
+    assert phase.next_delay() == _PERIOD_S
@@ -0,0 +1,105 @@
+"""Tests for the budget of Fernportal requests."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.xtherma_fp.const import (
+    FERNPORTAL_RATE_LIMIT_S,
+    FERNPORTAL_REQUESTS_PER_DAY,
+    FERNPORTAL_URL,
+)
+from custom_components.xtherma_fp.rest_budget import RestBudget, get_budget
+from custom_components.xtherma_fp.xtherma_client_common import XthermaRestBusyError
+from tests.const import MOCK_API_KEY, MOCK_SERIAL_NUMBER
+from tests.helpers import load_mock_data
+
+from .conftest import init_integration
+
+
+def test_rest_budget_shared_evenly():
+    """Verify that clients of one API key share its budget evenly."""
+    budget = get_budget(MOCK_API_KEY)
+    assert get_budget(MOCK_API_KEY) is budget
+    assert get_budget("other") is not budget
+
+    budget.add_poller()
+    assert budget.poll_interval() == timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+    budget.add_poller()
+    assert timedelta(seconds=119) < budget.poll_interval() < timedelta(seconds=121)
+    budget.remove_poller()
+    assert budget.poll_interval() == timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+
+
+def test_rest_budget_headroom(freezer):
+    """Verify that unused budget is spent on faster polls, one per minute."""
+    rate_limit = timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+    budget = RestBudget(capacity=2)
+    for _ in range(3):
+        budget.add_poller()
+    interval = budget.poll_interval()
+    assert rate_limit <= budget.next_poll(interval) < interval
+    # polls slower than the even share are not sped up
+    assert budget.next_poll(interval * 2) == interval * 2
+    # polls are never faster than the rate limit
+    assert budget.next_poll(rate_limit / 2) > rate_limit / 2
+
+    budget.acquire()
+    # no burst of requests, even with budget left
+    with pytest.raises(XthermaRestBusyError):
+        budget.acquire()
+    assert budget.next_poll(rate_limit / 2) > rate_limit
+    # headroom is used up
+    assert budget.next_poll(interval) == interval
+
+    freezer.tick(rate_limit)
+    budget.acquire()
+
+
+def test_rest_budget_exhausted(freezer):
+    """Verify that polls wait until budget is left."""
+    rate_limit = timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+    budget = RestBudget(requests_per_day=FERNPORTAL_REQUESTS_PER_DAY // 10)
+    interval = budget.poll_interval()
+    assert interval > rate_limit * 9
+
+    for _ in range(3):
+        budget.acquire()
+        freezer.tick(rate_limit)
+    with pytest.raises(XthermaRestBusyError):
+        budget.acquire()
+    # polls wait for the next request in budget
+    assert budget.next_poll(rate_limit) > rate_limit * 5
+
+    freezer.tick(interval)
+    budget.acquire()
+
+
+async def test_rest_budget_retry_after(hass, freezer, aioclient_mock):
+    """Verify that no requests are sent while Fernportal throttles them."""
+    mock_data = load_mock_data("rest_response.json")
+    url = f"{FERNPORTAL_URL}/{MOCK_SERIAL_NUMBER}"
+    aioclient_mock.get(url, json=mock_data)
+    entry = await init_integration(hass, None)
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.last_update_success
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=429, headers={"Retry-After": "600"})
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.update_interval > timedelta(seconds=600)
+    assert aioclient_mock.call_count == 1
+
+    freezer.tick(timedelta(seconds=300))
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert aioclient_mock.call_count == 1
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, json=mock_data)
+    freezer.tick(timedelta(seconds=301))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert aioclient_mock.call_count == 1
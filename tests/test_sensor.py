@@ -70,8 +70,8 @@ def _test_get_negative_number_modbus_regs() -> list[MockModbusParam]:
     # power
     set_modbus_register(param[0], "out_hp", twos_complement(-600 // 10))
 
-    # energy
-    set_modbus_register(param[0], "day_hp_out_h", twos_complement(-5000 * 100))
+    # energy, a register holds 16 bits only
+    set_modbus_register(param[0], "day_hp_out_h", twos_complement(-300 * 100))
 
     # frequency
     set_modbus_register(param[0], "vf", twos_complement(-15))
@@ -99,7 +99,7 @@ async def test_get_negative_number_modbus(hass, mock_modbus_tcp_client):
     assert state.state == "-600"
 
     state = hass.states.get(SENSOR_ENTITY_ID_MODBUS_DAY_HP_OUT_H)
-    assert state.state == "-5000.0"
+    assert state.state == "-300.0"
 
     state = hass.states.get(SENSOR_ENTITY_ID_MODBUS_LD1)
     assert state.state == "-10"
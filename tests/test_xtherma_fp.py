@@ -1,5 +1,10 @@
 """Tests for the Xtherma API."""
 
+import json
+from datetime import timedelta
+from http import HTTPStatus
+from unittest.mock import patch
+
 import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_API_KEY
@@ -10,13 +15,17 @@ from pytest_homeassistant_custom_component.common import (
 from custom_components.xtherma_fp.const import (
     CONF_SERIAL_NUMBER,
     DOMAIN,
+    FERNPORTAL_RATE_LIMIT_S,
     FERNPORTAL_URL,
 )
+from custom_components.xtherma_fp.xtherma_client_rest import XthermaClientRest
 from tests.const import MOCK_API_KEY, MOCK_SERIAL_NUMBER
-from tests.helpers import load_mock_data, provide_rest_data
+from tests.helpers import flatten_mock_data, load_mock_data, provide_rest_data
 
 from .conftest import init_integration
 
+JSON_LOADS_PATH = "custom_components.xtherma_fp.xtherma_client_rest.json_loads"
+
 
 async def test_restapi_setup_entry_old(hass, aioclient_mock):
     """Verify old config entries without CONF_CONNECTION work."""
@@ -52,6 +61,105 @@ async def test_restapi_setup_entry_ok(hass, mock_rest_api_client):
     assert entry.state is ConfigEntryState.LOADED
 
 
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+async def test_restapi_result_cache(
+    hass, freezer, aioclient_mock, mock_rest_api_client
+):
+    """Verify refreshes right after a poll do not request Fernportal again."""
+    entry = await init_integration(hass, mock_rest_api_client)
+    coordinator = entry.runtime_data.coordinator
+    assert aioclient_mock.call_count == 1
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert aioclient_mock.call_count == 1
+
+    # regular polls always read
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert aioclient_mock.call_count == 2
+
+
+async def test_restapi_conditional_request(hass, freezer, aioclient_mock):
+    """Verify unmodified data is neither transferred nor parsed again."""
+    mock_data = load_mock_data("rest_response.json")
+    url = f"{FERNPORTAL_URL}/{MOCK_SERIAL_NUMBER}"
+    aioclient_mock.get(url, json=mock_data, headers={"ETag": '"v1"'})
+    entry = await init_integration(hass, None)
+    coordinator = entry.runtime_data.coordinator
+    data = coordinator.data
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=HTTPStatus.NOT_MODIFIED)
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data == data
+    headers = aioclient_mock.mock_calls[-1][3]
+    assert headers["If-None-Match"] == '"v1"'
+
+
+async def test_restapi_conditional_request_malformed(hass, freezer, aioclient_mock):
+    """Verify validators of responses which could not be parsed are not sent."""
+    mock_data = load_mock_data("rest_response.json")
+    url = f"{FERNPORTAL_URL}/{MOCK_SERIAL_NUMBER}"
+    aioclient_mock.get(url, json=mock_data, headers={"ETag": '"v1"'})
+    entry = await init_integration(hass, None)
+    coordinator = entry.runtime_data.coordinator
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, text="{", headers={"ETag": '"v2"'})
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(url, status=HTTPStatus.NOT_MODIFIED)
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    # the data last parsed is confirmed, not the malformed one
+    headers = aioclient_mock.mock_calls[-1][3]
+    assert headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+async def test_restapi_unchanged_body(
+    hass, freezer, aioclient_mock, mock_rest_api_client
+):
+    """Verify identical responses are not parsed again."""
+    entry = await init_integration(hass, mock_rest_api_client)
+    coordinator = entry.runtime_data.coordinator
+    data = coordinator.data
+
+    with patch(JSON_LOADS_PATH) as json_loads:
+        freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+        await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.data == data
+    json_loads.assert_not_called()
+    # the server sent no validators, so the request was not conditional
+    assert "If-None-Match" not in aioclient_mock.mock_calls[-1][3]
+
+
+def test_restapi_parse_known_keys():
+    """Verify only known keys are parsed, with the input factors sent."""
+    mock_data = load_mock_data("rest_response.json")
+    keys = {
+        entry["key"]
+        for entry in flatten_mock_data(load_mock_data("rest_response.json"))
+    }
+    telemetry = mock_data["telemetry"]
+    telemetry.append({"key": "unknown", "value": "x", "input_factor": "/10"})
+    tvl = next(entry for entry in telemetry if entry["key"] == "tvl")
+    tvl["input_factor"] = "/100"
+    client = XthermaClientRest(FERNPORTAL_URL, MOCK_API_KEY, MOCK_SERIAL_NUMBER, None)
+
+    result = client._parse_body(json.dumps(mock_data).encode())  # noqa: SLF001
+    assert result.keys() == keys
+    assert result["tvl"] == 2.61
+    assert result["ta"] == 13.5
+
+
 @pytest.mark.parametrize(
     "mock_rest_api_client", provide_rest_data(http_error=429), indirect=True
 )
@@ -0,0 +1,111 @@
+"""Tests for reading Fernportal while Modbus cannot be read."""
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_API_KEY
+
+from custom_components.xtherma_fp.const import FERNPORTAL_RATE_LIMIT_S
+from custom_components.xtherma_fp.xtherma_client_hybrid import (
+    DataSource,
+    XthermaClientHybrid,
+)
+from tests.const import MOCK_API_KEY
+from tests.helpers import provide_modbus_data, provide_rest_data
+
+from .conftest import init_modbus_integration
+
+if TYPE_CHECKING:
+    from custom_components.xtherma_fp import XthermaData
+
+RECONNECT_DELAY_PATH = "custom_components.xtherma_fp.modbus_connection.reconnect_delay"
+
+
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", [provide_modbus_data()[0] * 2], indirect=True
+)
+async def test_hybrid_failover(
+    hass, freezer, aioclient_mock, mock_modbus_tcp_client, mock_rest_api_client
+):
+    """Verify that Fernportal is read while the Modbus connection is down."""
+    entry = await init_modbus_integration(
+        hass, mock_modbus_tcp_client, config_data={CONF_API_KEY: MOCK_API_KEY}
+    )
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    client = cast("XthermaClientHybrid", coordinator._client)  # noqa: SLF001
+    assert isinstance(client, XthermaClientHybrid)
+    assert not client.is_failed_over
+    assert aioclient_mock.call_count == 0
+    assert client.get_diagnostics()["sources"]["ta"]["source"] == DataSource.MODBUS
+
+    # lose connection, values are read from Fernportal
+    mock_modbus_tcp_client.close()
+    with patch(RECONNECT_DELAY_PATH, return_value=0):
+        freezer.tick(coordinator.update_interval)
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert client.is_failed_over
+        assert aioclient_mock.call_count == 1
+        diagnostics = client.get_diagnostics()
+        assert diagnostics["failed_over"]
+        assert diagnostics["sources"]["ta"]["source"] == DataSource.REST
+        # polls follow the budget of Fernportal
+        assert coordinator.update_interval >= timedelta(seconds=FERNPORTAL_RATE_LIMIT_S)
+
+        await client._primary._connection._reconnect_task  # noqa: SLF001
+
+    # Modbus is read again once reconnected
+    freezer.tick(timedelta(seconds=FERNPORTAL_RATE_LIMIT_S))
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert not client.is_failed_over
+    assert aioclient_mock.call_count == 1
+    assert client.get_diagnostics()["sources"]["ta"]["source"] == DataSource.MODBUS
+
+
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_hybrid_setup_without_modbus(
+    hass, aioclient_mock, mock_modbus_tcp_client, mock_rest_api_client
+):
+    """Verify that entries are set up from Fernportal if Modbus is down."""
+    mock_modbus_tcp_client.connect.side_effect = None
+    mock_modbus_tcp_client.connect.return_value = False
+    with patch(RECONNECT_DELAY_PATH, return_value=3600):
+        entry = await init_modbus_integration(
+            hass, mock_modbus_tcp_client, config_data={CONF_API_KEY: MOCK_API_KEY}
+        )
+        assert entry.state is ConfigEntryState.LOADED
+        client = cast("XthermaClientHybrid", entry.runtime_data.coordinator._client)  # noqa: SLF001
+        assert client.is_failed_over
+        assert aioclient_mock.call_count == 1
+        await hass.config_entries.async_unload(entry.entry_id)
+
+
+@pytest.mark.parametrize("mock_rest_api_client", provide_rest_data(), indirect=True)
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+async def test_hybrid_rejected_write_not_reported(
+    hass, caplog, mock_modbus_tcp_client, mock_rest_api_client
+):
+    """Verify that rejected writes are not reported while failed over."""
+    mock_modbus_tcp_client.connect.side_effect = None
+    mock_modbus_tcp_client.connect.return_value = False
+    with patch(RECONNECT_DELAY_PATH, return_value=3600):
+        entry = await init_modbus_integration(
+            hass, mock_modbus_tcp_client, config_data={CONF_API_KEY: MOCK_API_KEY}
+        )
+        coordinator = entry.runtime_data.coordinator
+        assert coordinator._client.is_failed_over  # noqa: SLF001
+
+        coordinator._block_until("451", 0, 16)  # noqa: SLF001
+        with caplog.at_level(logging.WARNING):
+            coordinator._reject_writes(["451"], {"451": 3})  # noqa: SLF001
+        assert "did not accept" not in caplog.text
+        assert not coordinator._pending_writes  # noqa: SLF001
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -1,19 +1,38 @@
 """Tests for the Xtherma Modbus API."""
 
-from typing import TYPE_CHECKING, Any
+import asyncio
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from homeassistant.components.sensor import DOMAIN as DOMAIN_SENSOR
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import UpdateFailed
-
-from custom_components.xtherma_fp.const import CONF_DETECT_EMPTY_MODBUS_DATA, DOMAIN
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.xtherma_fp.const import (
+    CONF_DETECT_EMPTY_MODBUS_DATA,
+    CONF_STANDBY_UPDATE_INTERVAL,
+    DEFAULT_STALE_GRACE_PERIOD_S,
+    DOMAIN,
+    EXTRA_STATE_ATTRIBUTE_LAST_READ,
+)
+from custom_components.xtherma_fp.coordinator import UpdateCycleStats
 from custom_components.xtherma_fp.entity_descriptors import (
     MODBUS_ENTITY_DESCRIPTIONS,
-    MODBUS_REGISTER_RANGES,
 )
-from custom_components.xtherma_fp.vendor.pymodbus import ExcCodes
+from custom_components.xtherma_fp.modbus_plan import MODBUS_REGISTER_RANGES
+from custom_components.xtherma_fp.vendor.pymodbus import ExcCodes, ModbusException
+from custom_components.xtherma_fp.xtherma_client_common import XthermaModbusBusyError
+from custom_components.xtherma_fp.xtherma_client_modbus import (
+    ModbusRetryPolicy,
+    ModbusRetryStats,
+    XthermaClientModbus,
+)
 from tests.conftest import MockModbusParam
 from tests.helpers import (
     get_modbus_register_number,
@@ -34,6 +53,8 @@ SWITCH_ENTITY_ID_MODBUS_450 = (
     "switch.test_entry_xtherma_modbus_config_cooling_curve_2_active"
 )
 
+BINARY_SENSOR_ENTITY_ID_MODBUS_PWW = "binary_sensor.test_entry_xtherma_modbus_config_pww_circulation_pump_hot_water_enabled"
+
 
 @pytest.mark.parametrize(
     "mock_modbus_tcp_client",
@@ -47,6 +68,8 @@ async def test_async_setup_entry_modbus_ok(hass, mock_modbus_tcp_client):
 
     assert len(hass.config_entries.async_entries(DOMAIN)) == 1
     assert entry.state is ConfigEntryState.LOADED
+    # range reads are pipelined
+    mock_modbus_tcp_client.set_pipelined.assert_called_once_with(True)  # noqa: FBT003
 
 
 @pytest.mark.parametrize(
@@ -120,13 +143,377 @@ async def test_modbus_runtime_read_busy(hass, mock_modbus_tcp_client, caplog):
     )
 
 
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    [provide_modbus_data()[0] * 2],
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_concurrent_reads(hass, mock_modbus_tcp_client):
+    """Test that concurrent callers share one read of the device."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    client = xtherma_data.coordinator._client  # noqa: SLF001
+    read = mock_modbus_tcp_client.read_holding_registers
+    read.reset_mock()
+
+    first, second = await asyncio.gather(
+        client.async_get_data(), client.async_get_data()
+    )
+    assert first == second
+    assert "mode" in first
+    # telemetry only, settings are not yet due
+    assert read.call_count == 1
+
+
+@pytest.mark.parametrize("mock_modbus_tcp_client", provide_modbus_data(), indirect=True)
+@pytest.mark.asyncio
+async def test_modbus_update_deadline(hass, mock_modbus_tcp_client):
+    """Test that a hanging update is aborted and cleaned up at its deadline."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    client = cast("XthermaClientModbus", coordinator._client)  # noqa: SLF001
+    coordinator._update_deadline_s = 0.01  # noqa: SLF001
+
+    async def hang(address: int, count: int, device_id: int) -> None:
+        await asyncio.Event().wait()
+
+    mock_modbus_tcp_client.read_holding_registers.side_effect = hang
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert coordinator.last_exception.translation_key == "timeout_error"
+    assert coordinator.cycle_stats == UpdateCycleStats(overruns=1)
+    # the read was stopped and its request slot released
+    read_task = client._read_task  # noqa: SLF001
+    assert read_task is not None
+    with pytest.raises(asyncio.CancelledError):
+        await read_task
+    assert client._read_task is None  # noqa: SLF001
+    assert client._connection._slots._in_use == 0  # noqa: SLF001
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client", [provide_modbus_data()[0] * 2], indirect=True
+)
+@pytest.mark.asyncio
+async def test_modbus_update_skipped(hass, mock_modbus_tcp_client):
+    """Test that refreshes are skipped while an update still runs."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    read = mock_modbus_tcp_client.read_holding_registers
+    serve_prepared_data = read.side_effect
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_read(address: int, count: int, device_id: int) -> Mock:
+        started.set()
+        await release.wait()
+        return serve_prepared_data(address, count, device_id)
+
+    read.side_effect = slow_read
+    read.reset_mock()
+    slow_update = asyncio.create_task(coordinator.async_refresh())
+    await started.wait()
+    await coordinator.async_refresh()
+    assert coordinator.cycle_stats == UpdateCycleStats(skipped=1)
+    release.set()
+    await slow_update
+    assert coordinator.last_update_success
+    assert read.call_count == 1
+
+
+def _test_modbus_adaptive_update_interval() -> list[MockModbusParam]:
+    # setup and three updates in standby, then the compressor starts
+    param_standby: list[MockModbusParam] = provide_modbus_data()
+    set_modbus_register(param_standby[0], "mode", 0)
+    set_modbus_register(param_standby[0], "pww", 0)
+    param_active: list[MockModbusParam] = provide_modbus_data()
+    set_modbus_register(param_active[0], "mode", 0)
+    set_modbus_register(param_active[0], "pww", 0)
+    set_modbus_register(param_active[0], "vf", 40)
+    telemetry = param_standby[0][-1:]
+    return [param_standby[0] + telemetry * 3 + param_active[0][-1:]]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_adaptive_update_interval(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_adaptive_update_interval(hass, mock_modbus_tcp_client):
+    """Test that updates back off in standby and speed up when active."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    assert coordinator.update_interval == timedelta(seconds=30)
+
+    intervals = []
+    for _ in range(4):
+        await coordinator.async_refresh()
+        intervals.append(coordinator.update_interval.total_seconds())
+    assert intervals == [60, 120, 120, 30]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_adaptive_update_interval(),
+    indirect=True,
+)
+@pytest.mark.parametrize(
+    ("standby_update_interval", "expected"),
+    [(300, [60, 120, 240, 30]), (0, [30, 30, 30, 30])],
+)
+@pytest.mark.asyncio
+async def test_modbus_standby_update_interval_option(
+    hass, mock_modbus_tcp_client, standby_update_interval, expected
+):
+    """Test that updates in standby back off up to the configured interval."""
+    entry = await init_modbus_integration(
+        hass,
+        mock_modbus_tcp_client,
+        options={CONF_STANDBY_UPDATE_INTERVAL: standby_update_interval},
+    )
+    coordinator = entry.runtime_data.coordinator
+
+    intervals = []
+    for _ in range(4):
+        await coordinator.async_refresh()
+        intervals.append(coordinator.update_interval.total_seconds())
+    assert intervals == expected
+
+
+def _test_modbus_read_busy_retry() -> list[MockModbusParam]:
+    # the telemetry range is busy twice before it can be read
+    param: list[MockModbusParam] = provide_modbus_data()
+    busy: list[MockModbusParam] = provide_modbus_data(exc_code=ExcCodes.DEVICE_BUSY)
+    return [busy[0][1:] * 2 + param[0]]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_read_busy_retry(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_read_busy_retry(hass, mock_modbus_tcp_client):
+    """Test that reads are retried while the device is busy."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    assert entry.state.value == "loaded"
+
+    xtherma_data: XthermaData = entry.runtime_data
+    assert xtherma_data.coordinator.last_update_success
+    client = cast("XthermaClientModbus", xtherma_data.coordinator._client)  # noqa: SLF001
+    assert client.retry_stats == ModbusRetryStats(retries=2, recovered=1)
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "water"
+
+
+@pytest.mark.asyncio
+async def test_modbus_retry_deadline():
+    """Test that busy retries stop at the deadline."""
+    client = XthermaClientModbus(host="localhost", port=502, address=1)
+    client.retry_policy = ModbusRetryPolicy(initial_delay_s=1, jitter=0)
+    request = AsyncMock(side_effect=XthermaModbusBusyError)
+    with pytest.raises(XthermaModbusBusyError):
+        await client._retry_busy(request, deadline=time.monotonic() + 0.5)  # noqa: SLF001
+    assert request.await_count == 1
+    assert client.retry_stats == ModbusRetryStats(exhausted=1)
+
+
+def test_modbus_retry_delay():
+    """Test that retry delays grow exponentially up to a maximum."""
+    policy = ModbusRetryPolicy(initial_delay_s=0.2, max_delay_s=2, jitter=0.2)
+    assert 0.16 <= policy.delay(0) <= 0.24
+    assert 0.64 <= policy.delay(2) <= 0.96
+    assert 1.6 <= policy.delay(10) <= 2.4
+
+
+def _test_modbus_partial_read_failure() -> list[MockModbusParam]:
+    # prepare register set for 2 update cyles:
+    # 1. settings range fails, telemetry ok (for config entry setup)
+    # 2. all ranges ok, the failed settings range is still due
+    param_setup: list[MockModbusParam] = provide_modbus_data()
+    param_runtime: list[MockModbusParam] = provide_modbus_data()
+    param_setup[0][0]["exc_code"] = ExcCodes.DEVICE_FAILURE
+    return [param_setup[0] + param_runtime[0]]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_partial_read_failure(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_partial_read_failure(hass, mock_modbus_tcp_client):
+    """Test that one failed range does not discard the data of other ranges."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    assert entry.state.value == "loaded"
+
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    assert coordinator.last_update_success
+
+    # telemetry is shown, settings are unavailable until read
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "water"
+    assert hass.states.get(SWITCH_ENTITY_ID_MODBUS_450).state == "unavailable"
+    assert coordinator.data_age("mode") is not None
+    assert coordinator.data_age("450") is None
+    mock_modbus_tcp_client.read_holding_registers.reset_mock()
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # the failed range is read again along with telemetry
+    addresses = [
+        call.kwargs["address"]
+        for call in mock_modbus_tcp_client.read_holding_registers.call_args_list
+    ]
+    assert addresses == [r.first_reg for r in MODBUS_REGISTER_RANGES]
+    assert hass.states.get(SWITCH_ENTITY_ID_MODBUS_450).state == "on"
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "water"
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    provide_modbus_data(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_values_become_stale(hass, freezer, mock_modbus_tcp_client):
+    """Test that values become stale after several missed updates."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+
+    freezer.tick(timedelta(seconds=60))
+    assert coordinator.is_available("mode")
+    assert coordinator.get_stale_read_time("mode") is None
+
+    # telemetry missed three updates, settings are read less frequently
+    freezer.tick(timedelta(seconds=60))
+    assert coordinator.is_available("mode")
+    assert coordinator.get_stale_read_time("mode") is not None
+    assert coordinator.get_stale_read_time("450") is None
+
+    # stale values are shown for the grace period after they became stale
+    coordinator.stale_grace_period = 60
+    assert coordinator.is_available("mode")
+    freezer.tick(timedelta(seconds=60))
+    assert not coordinator.is_available("mode")
+    assert coordinator.is_available("450")
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    provide_modbus_data(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_stale_while_revalidate(hass, freezer, mock_modbus_tcp_client):
+    """Test that failed updates keep values until the grace period expired."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
+    coordinator = xtherma_data.coordinator
+    mock_modbus_tcp_client.read_holding_registers.side_effect = ModbusException(
+        "timeout"
+    )
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    # a transient error does not touch any state
+    freezer.tick(timedelta(seconds=30))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not coordinator.last_update_success
+    assert events == []
+
+    # values which missed several updates are marked as stale
+    for _ in range(3):
+        freezer.tick(timedelta(seconds=30))
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(SENSOR_ENTITY_ID_MODE)
+    assert state.state == "water"
+    assert state.attributes[EXTRA_STATE_ATTRIBUTE_LAST_READ] is not None
+    assert hass.states.get(SWITCH_ENTITY_ID_MODBUS_450).state == "on"
+
+    # values become unavailable when the grace period expired
+    freezer.tick(timedelta(seconds=DEFAULT_STALE_GRACE_PERIOD_S))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "unavailable"
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    provide_modbus_data(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_settings_stale_while_revalidate(
+    hass, freezer, mock_modbus_tcp_client
+):
+    """Test that failed updates mark settings stale within the grace period."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+    mock_modbus_tcp_client.read_holding_registers.side_effect = ModbusException(
+        "timeout"
+    )
+
+    for _ in range(2):
+        freezer.tick(timedelta(seconds=30))
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get(SWITCH_ENTITY_ID_MODBUS_450)
+    assert state.state == "on"
+    assert state.attributes[EXTRA_STATE_ATTRIBUTE_LAST_READ] is not None
+
+    # settings are read rarely, but are not shown longer than other values
+    freezer.tick(timedelta(seconds=DEFAULT_STALE_GRACE_PERIOD_S))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(SWITCH_ENTITY_ID_MODBUS_450).state == "unavailable"
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    provide_modbus_data(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_short_grace_period(hass, freezer, mock_modbus_tcp_client):
+    """Test that failed updates keep values no longer than a short grace period."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    coordinator = entry.runtime_data.coordinator
+    coordinator.stale_grace_period = 45
+    mock_modbus_tcp_client.read_holding_registers.side_effect = ModbusException(
+        "timeout"
+    )
+
+    freezer.tick(timedelta(seconds=30))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "water"
+
+    freezer.tick(timedelta(seconds=30))
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(SENSOR_ENTITY_ID_MODE).state == "unavailable"
+
+
+@callback
+def _any_event(event_data: Any) -> bool:
+    return True
+
+
 def _test_modbus_update_events() -> list[MockModbusParam]:
     # prepare register set for 2 update cyles:
     # 1. initial data in for config entry setup
-    # 2. parameter #450 changes in next update
+    # 2. telemetry value pww changes in next update
     param_setup: list[MockModbusParam] = provide_modbus_data()
     param_runtime: list[MockModbusParam] = provide_modbus_data()
-    set_modbus_register(param_runtime[0], "450", 0)
+    set_modbus_register(param_runtime[0], "pww", 0)
     return [param_setup[0] + param_runtime[0]]
 
 
@@ -139,8 +526,8 @@ def _test_modbus_update_events() -> list[MockModbusParam]:
 async def test_modbus_update_events(hass, mock_modbus_tcp_client):
     """Test that only actual value changes cause a state update.
 
-    Our entities unconditionally update their state on each coordinator update.
-    Verify that only actual value changes cause a state change event to be fired.
+    The coordinator only notifies entities whose value changed, so neither
+    state changes nor state reports are fired for unchanged entities.
     """
     entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
     assert entry.state.value == "loaded"
@@ -156,18 +543,109 @@ async def test_modbus_update_events(hass, mock_modbus_tcp_client):
         events.append(event)
 
     unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, event_listener_callback)
+    unsub_reported = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, event_listener_callback, event_filter=_any_event
+    )
 
     await xtherma_data.coordinator.async_request_refresh()
     await hass.async_block_till_done()
 
     assert len(events) == 1
-    assert events[0].data["entity_id"] == SWITCH_ENTITY_ID_MODBUS_450
+    assert events[0].data["entity_id"] == BINARY_SENSOR_ENTITY_ID_MODBUS_PWW
+
+    await hass.async_block_till_done()
+
+    unsub()
+    unsub_reported()
+
+
+def _test_modbus_full_dispatch() -> list[MockModbusParam]:
+    # prepare register set for 3 update cyles, no value ever changes
+    return [
+        provide_modbus_data()[0] + provide_modbus_data()[0] + provide_modbus_data()[0]
+    ]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_full_dispatch(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_full_dispatch(hass, freezer, mock_modbus_tcp_client):
+    """Test that all entities report their state in regular intervals."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    xtherma_data: XthermaData = entry.runtime_data
 
+    events: list[Any] = []
+    unsub = hass.bus.async_listen(
+        EVENT_STATE_REPORTED, events.append, event_filter=_any_event
+    )
+
+    # unchanged values are not dispatched
+    freezer.tick(timedelta(seconds=60))
+    await xtherma_data.coordinator.async_refresh()
     await hass.async_block_till_done()
+    assert xtherma_data.coordinator.last_update_success
+    assert not events
+
+    # until a full dispatch is due
+    freezer.tick(timedelta(seconds=900))
+    await xtherma_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert BINARY_SENSOR_ENTITY_ID_MODBUS_PWW in {
+        event.data["entity_id"] for event in events
+    }
 
     unsub()
 
 
+def _test_modbus_settings_update_period() -> list[MockModbusParam]:
+    # prepare register set for 2 update cyles:
+    # 1. initial data in for config entry setup
+    # 2. parameter #450 changes, but settings are not yet due for an update
+    param_setup: list[MockModbusParam] = provide_modbus_data()
+    param_runtime: list[MockModbusParam] = provide_modbus_data()
+    set_modbus_register(param_runtime[0], "450", 0)
+    return [param_setup[0] + param_runtime[0]]
+
+
+@pytest.mark.parametrize(
+    "mock_modbus_tcp_client",
+    _test_modbus_settings_update_period(),
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_modbus_settings_update_period(hass, mock_modbus_tcp_client):
+    """Test that settings are read less frequently than telemetry."""
+    entry = await init_modbus_integration(hass, mock_modbus_tcp_client)
+    assert entry.state.value == "loaded"
+
+    xtherma_data: XthermaData = entry.runtime_data
+    assert xtherma_data is not None
+    assert xtherma_data.coordinator is not None
+
+    # initial update reads all register ranges
+    addresses = [
+        call.kwargs["address"]
+        for call in mock_modbus_tcp_client.read_holding_registers.call_args_list
+    ]
+    assert addresses == [r.first_reg for r in MODBUS_REGISTER_RANGES]
+    mock_modbus_tcp_client.read_holding_registers.reset_mock()
+
+    await xtherma_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # next update only reads telemetry, settings are kept from the last read
+    addresses = [
+        call.kwargs["address"]
+        for call in mock_modbus_tcp_client.read_holding_registers.call_args_list
+    ]
+    assert addresses == [MODBUS_REGISTER_RANGES[-1].first_reg]
+    assert xtherma_data.coordinator.last_update_success
+    assert hass.states.get(SWITCH_ENTITY_ID_MODBUS_450).state == "on"
+
+
 def _test_provide_modbus_empty_data() -> list[MockModbusParam]:
     # prepare register set for 2 update cyles:
     # 1. initial data in for config entry setup
@@ -204,7 +682,7 @@ async def test_modbus_drop_empty_data(hass, mock_modbus_tcp_client, caplog):
     unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, event_listener_callback)
 
     # trigger next update reading empty data
-    await xtherma_data.coordinator.async_request_refresh()
+    await xtherma_data.coordinator.async_refresh()
     await hass.async_block_till_done()
 
     # there must be no state changes
@@ -250,7 +728,7 @@ async def test_modbus_use_empty_data(hass, mock_modbus_tcp_client, caplog):
     unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, event_listener_callback)
 
     # trigger next update reading empty data
-    await xtherma_data.coordinator.async_request_refresh()
+    await xtherma_data.coordinator.async_refresh()
     await hass.async_block_till_done()
 
     # there must be state changes